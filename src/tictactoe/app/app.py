@@ -13,6 +13,17 @@ from tictactoe.screens.window_manager import get_initial_window_size, save_windo
 
 logger = get_logger()
 
+# Input is polled faster than frames are drawn so clicks and key presses
+# are picked up promptly; frames are presented only when input arrived or
+# the pointer moved (hover highlights), capped at MAX_FPS.
+INPUT_POLL_HZ = 240
+MAX_FPS = 60
+FRAME_MS = 1000 // MAX_FPS
+
+# With no input, scenes only need repainting for time-based effects such as
+# the menu cursor blink, so idle frames are presented at this interval.
+IDLE_REDRAW_MS = 250
+
 
 class TicTacToeApp:
     """Main application class with state machine."""
@@ -107,18 +118,14 @@ class TicTacToeApp:
 
         clock = pygame.time.Clock()
         running = True
-        frame_count = 0
+        last_draw = -IDLE_REDRAW_MS
+        needs_draw = True
+        last_mouse_pos = pygame.mouse.get_pos()
 
         while running:
-            frame_count += 1
-            logger.debug(f"App.run - frame {frame_count}")
-
             events = pygame.event.get()
-            logger.debug(f"App.run - got {len(events)} events")
 
             for event in events:
-                logger.debug(f"App.run - processing event: {event.type}")
-
                 if event.type == pygame.QUIT:
                     logger.info("QUIT event received")
                     running = False
@@ -135,7 +142,6 @@ class TicTacToeApp:
                 break
 
             for event in events:
-                logger.debug(f"App.run - passing event to scene manager: {event.type}")
                 result = self.scene_manager.handle_event(event)
                 if result == SceneTransition.QUIT:
                     logger.info("Scene manager requested quit")
@@ -144,11 +150,18 @@ class TicTacToeApp:
                 elif result:
                     logger.debug(f"App.run - scene transition: {result}")
 
-            logger.debug("App.run - calling scene_manager.draw")
-            self.scene_manager.draw(self.screen)
-
-            pygame.display.flip()
-            clock.tick(60)
+            mouse_pos = pygame.mouse.get_pos()
+            needs_draw = needs_draw or bool(events) or mouse_pos != last_mouse_pos
+            last_mouse_pos = mouse_pos
+            now = pygame.time.get_ticks()
+            since_draw = now - last_draw
+            if (needs_draw and since_draw >= FRAME_MS) or since_draw >= IDLE_REDRAW_MS:
+                self.scene_manager.draw(self.screen)
+
+                pygame.display.flip()
+                last_draw = now
+                needs_draw = False
+            clock.tick(INPUT_POLL_HZ)
 
         logger.info("Application loop ended")
         logger.debug("App.run END")
@@ -10,10 +10,26 @@ import pygame
 
 from ..ui.layout import Layout
 
+# Events that menu-style scenes never handle; blocking them keeps SDL from
+# queueing them at all while such a scene is active. Mouse motion is left
+# out because it is what wakes the app loop to repaint hover highlights.
+MENU_BLOCKED_EVENTS = (
+    pygame.ACTIVEEVENT,
+    pygame.VIDEOEXPOSE,
+    pygame.JOYAXISMOTION,
+    pygame.JOYBALLMOTION,
+    pygame.JOYHATMOTION,
+    pygame.FINGERMOTION,
+)
+
 
 class Scene(ABC):
     """Base class for all game scenes."""
 
+    __slots__ = ("width", "height", "layout", "_last_size")
+
+    blocked_events: tuple[int, ...] = ()
+
     def __init__(self, width: int, height: int):
         """
         Initialize the scene.
@@ -50,6 +66,37 @@ class Scene(ABC):
         """
         pass
 
+    @staticmethod
+    def _to_display_format(
+        surface: pygame.Surface, alpha: bool = True
+    ) -> pygame.Surface:
+        """
+        Convert a cached surface to the display's pixel format for fast blits.
+
+        Before a video mode is set (e.g. when a scene is built headless) the
+        surface is returned unchanged.
+
+        Args:
+            surface: Surface to convert
+            alpha: Keep per-pixel alpha (convert_alpha) rather than convert
+
+        Returns:
+            Converted surface, or the original when no display exists
+        """
+        if pygame.display.get_surface() is None:
+            return surface
+        return surface.convert_alpha() if alpha else surface.convert()
+
+    def on_enter(self) -> None:
+        """Block the events this scene ignores when it becomes active."""
+        if self.blocked_events:
+            pygame.event.set_blocked(list(self.blocked_events))
+
+    def on_leave(self) -> None:
+        """Re-allow every event type when this scene stops being active."""
+        if self.blocked_events:
+            pygame.event.set_allowed(None)
+
     def on_resize(self, width: int, height: int) -> None:
         """
         Handle window resize.
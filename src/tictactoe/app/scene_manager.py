@@ -71,7 +71,16 @@ class SceneManager:
         self.reset_scene = ResetScene(storage, width, height)
         self.game_scene = GameScene(storage, width, height)
 
+        self.scenes = {
+            "main_menu": self.main_menu_scene,
+            "leaderboard": self.leaderboard_scene,
+            "history": self.history_scene,
+            "reset": self.reset_scene,
+            "game": self.game_scene,
+        }
+
         self.current_scene = "main_menu"
+        self.main_menu_scene.on_enter()
 
         logger.info("SceneManager initialized")
 
@@ -113,13 +122,13 @@ class SceneManager:
         if result:
             match result:
                 case SceneTransition.MENU:
-                    self.current_scene = "main_menu"
+                    self._switch_to("main_menu")
                 case SceneTransition.LEADERBOARD:
-                    self.current_scene = "leaderboard"
+                    self._switch_to("leaderboard")
                 case SceneTransition.HISTORY:
-                    self.current_scene = "history"
+                    self._switch_to("history")
                 case SceneTransition.RESET:
-                    self.current_scene = "reset"
+                    self._switch_to("reset")
                 case SceneTransition.GAME:
                     return SceneTransition.GAME
                 case SceneTransition.QUIT:
@@ -127,7 +136,7 @@ class SceneManager:
                 case SceneTransition.RESET_CONFIRMED:
                     logger.info("Reset confirmed - executing reset")
                     self.storage.reset_data()
-                    self.current_scene = "main_menu"
+                    self._switch_to("main_menu")
 
         return None
 
@@ -185,9 +194,24 @@ class SceneManager:
 
     def set_scene(self, scene_name: str) -> None:
         """Set the current scene."""
-        self.current_scene = scene_name
+        self._switch_to(scene_name)
         logger.info(f"Switched to scene: {scene_name}")
 
+    def _switch_to(self, scene_name: str) -> None:
+        """
+        Make a scene current, running the leave/enter hooks on a change.
+
+        Args:
+            scene_name: Name of the scene to activate
+        """
+        if scene_name == self.current_scene:
+            return
+        if self.current_scene in self.scenes:
+            self.scenes[self.current_scene].on_leave()
+        self.current_scene = scene_name
+        if scene_name in self.scenes:
+            self.scenes[scene_name].on_enter()
+
     def start_pvp_game(self, player_x_name: str, player_o_name: str) -> None:
         """
         Start a Player vs Player game.
@@ -197,7 +221,7 @@ class SceneManager:
             player_o_name: Name of player O
         """
         self.game_scene.setup_game("pvp", player_x_name, player_o_name)
-        self.current_scene = "game"
+        self._switch_to("game")
         logger.info(f"Started PvP game: {player_x_name} vs {player_o_name}")
 
     def start_pvai_game(self, player_name: str, ai_difficulty) -> None:
@@ -209,5 +233,5 @@ class SceneManager:
             ai_difficulty: AI difficulty level
         """
         self.game_scene.setup_game("pvai", player_name, ai_difficulty=ai_difficulty)
-        self.current_scene = "game"
+        self._switch_to("game")
         logger.info(f"Started PvAI game: {player_name} vs AI ({ai_difficulty.value})")
@@ -23,3 +23,11 @@ class Depth(Enum):
 
 INFINITY = float("inf")
 NEGATIVE_INFINITY = float("-inf")
+
+
+class TTFlag(Enum):
+    """How a transposition table score relates to the true minimax value."""
+
+    EXACT = "exact"
+    LOWERBOUND = "lowerbound"
+    UPPERBOUND = "upperbound"
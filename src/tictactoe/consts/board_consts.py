@@ -6,6 +6,19 @@ from enum import Enum
 
 BOARD_SIZE = 3
 
+# Every winning line as flat (row * BOARD_SIZE + col) index triples:
+# rows, then columns, then the main and anti diagonals.
+WIN_LINES = (
+    (0, 1, 2),
+    (3, 4, 5),
+    (6, 7, 8),
+    (0, 3, 6),
+    (1, 4, 7),
+    (2, 5, 8),
+    (0, 4, 8),
+    (2, 4, 6),
+)
+
 
 class Player(Enum):
     """Player constants."""
@@ -2,6 +2,8 @@
 UI theme constants for tic-tac-toe game.
 """
 
+from enum import IntEnum
+
 
 # Color palette
 class Colors:
@@ -65,6 +67,16 @@ class FontSizes:
     TINY = 18
 
 
+# Font slots
+class FontSlot(IntEnum):
+    """Indices into the font tuple returned by make_fonts."""
+
+    TITLE = 0
+    UI = 1
+    MARK = 2
+    SMALL = 3
+
+
 # Layout constants
 class Layout:
     """Layout and spacing constants."""
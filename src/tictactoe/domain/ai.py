@@ -8,14 +8,176 @@ Difficulty Levels:
 """
 
 import random
+from functools import cache
 
-from ..consts.ai_consts import INFINITY, NEGATIVE_INFINITY, Depth, Difficulty
-from ..consts.board_consts import Player
+from ..consts.ai_consts import (
+    INFINITY,
+    NEGATIVE_INFINITY,
+    Depth,
+    Difficulty,
+    TTFlag,
+)
+from ..consts.board_consts import BOARD_SIZE, Player, Score
 from ..infra.logger import get_logger
-from .board import Board
+from .board import Board, canonical_key, find_winner, line_score
 
 logger = get_logger()
 
+_O = Player.O_PLAYER.value
+_WIN = Score.WIN.value
+_LOSE = Score.LOSE.value
+_DRAW = Score.DRAW.value
+
+# Centre first, then corners, then edges: the cells that sit on the most
+# winning lines tend to decide a position, so searching them first lets
+# alpha-beta cut the remaining siblings earlier.
+_MOVE_ORDER = ((1, 1), (0, 0), (0, 2), (2, 0), (2, 2), (0, 1), (1, 0), (1, 2), (2, 1))
+_MOVE_ORDER_BITS = tuple(1 << (row * BOARD_SIZE + col) for row, col in _MOVE_ORDER)
+
+
+def _minimax_bb(
+    x_bb: int,
+    o_bb: int,
+    depth: int,
+    is_max: bool,
+    alpha: float,
+    beta: float,
+    table: dict[tuple[int, bool], tuple[int, float, TTFlag]],
+) -> float:
+    """
+    Minimax with alpha-beta pruning on a pair of bitboards.
+
+    Mirrors AI.minimax, but moves are made by or-ing a bit into a copy of
+    the bitboards, so no Board is mutated and nothing is logged per node.
+    O_PLAYER is the maximizing side.
+
+    Args:
+        x_bb: Bitboard of the cells held by X_PLAYER
+        o_bb: Bitboard of the cells held by O_PLAYER
+        depth: Remaining search depth
+        is_max: True if O_PLAYER is to move, False if X_PLAYER is
+        alpha: Alpha value for pruning
+        beta: Beta value for pruning
+        table: Transposition table, shared with AI.minimax
+
+    Returns:
+        Score of the position
+    """
+    alpha_orig = alpha
+    beta_orig = beta
+    key = (canonical_key(x_bb, o_bb), is_max)
+    entry = table.get(key)
+    if entry is not None and entry[0] == depth:
+        _, score, flag = entry
+        if flag is TTFlag.EXACT:
+            return score
+        if flag is TTFlag.LOWERBOUND:
+            alpha = max(alpha, score)
+        else:
+            beta = min(beta, score)
+        if alpha >= beta:
+            return score
+
+    occupied = x_bb | o_bb
+    free_bits = [bit for bit in _MOVE_ORDER_BITS if not occupied & bit]
+    winner = find_winner(x_bb, o_bb)
+    if winner is not None or not free_bits or depth == 0:
+        if winner == _O:
+            score = _WIN
+        elif winner is not None:
+            score = _LOSE
+        elif not free_bits:
+            score = _DRAW
+        else:
+            score = line_score(x_bb, o_bb)
+        table[key] = (depth, score, TTFlag.EXACT)
+        return score
+
+    if is_max:
+        best = NEGATIVE_INFINITY
+        for bit in free_bits:
+            val = _minimax_bb(x_bb, o_bb | bit, depth - 1, False, alpha, beta, table)
+            best = max(best, val)
+            alpha = max(alpha, best)
+            if alpha >= beta:
+                break
+    else:
+        best = INFINITY
+        for bit in free_bits:
+            val = _minimax_bb(x_bb | bit, o_bb, depth - 1, True, alpha, beta, table)
+            best = min(best, val)
+            beta = min(beta, best)
+            if alpha >= beta:
+                break
+
+    if best <= alpha_orig:
+        flag = TTFlag.UPPERBOUND
+    elif best >= beta_orig:
+        flag = TTFlag.LOWERBOUND
+    else:
+        flag = TTFlag.EXACT
+    table[key] = (depth, best, flag)
+    return best
+
+
+@cache
+def _game_value(x_bb: int, o_bb: int, is_max: bool) -> int:
+    """
+    Exact minimax value of a position when both sides play perfectly.
+
+    Memoized for the life of the process; tic-tac-toe has only a few
+    thousand positions, so the cache fills during the first full-depth
+    search and later ones are lookups.
+
+    Args:
+        x_bb: Bitboard of the cells held by X_PLAYER
+        o_bb: Bitboard of the cells held by O_PLAYER
+        is_max: True if O_PLAYER is to move, False if X_PLAYER is
+
+    Returns:
+        Score of the position
+    """
+    winner = find_winner(x_bb, o_bb)
+    if winner is not None:
+        return _WIN if winner == _O else _LOSE
+    occupied = x_bb | o_bb
+    free_bits = [bit for bit in _MOVE_ORDER_BITS if not occupied & bit]
+    if not free_bits:
+        return _DRAW
+
+    if is_max:
+        return max(_game_value(x_bb, o_bb | bit, False) for bit in free_bits)
+    return min(_game_value(x_bb | bit, o_bb, True) for bit in free_bits)
+
+
+@cache
+def _perfect_move(x_bb: int, o_bb: int) -> tuple[int, int]:
+    """
+    Best move for O_PLAYER under perfect play.
+
+    Ties go to the first move in row-major order, as in a full-depth
+    minimax search.
+
+    Args:
+        x_bb: Bitboard of the cells held by X_PLAYER
+        o_bb: Bitboard of the cells held by O_PLAYER
+
+    Returns:
+        Tuple of (row, col) for the best move
+    """
+    occupied = x_bb | o_bb
+    best_move = None
+    best_score = NEGATIVE_INFINITY
+    for index in range(BOARD_SIZE * BOARD_SIZE):
+        bit = 1 << index
+        if occupied & bit:
+            continue
+        score = _game_value(x_bb, o_bb | bit, False)
+        if score > best_score:
+            best_score = score
+            best_move = divmod(index, BOARD_SIZE)
+    return best_move
+
 
 class AI:
     """AI opponent for tic-tac-toe using minimax algorithm."""
@@ -30,6 +192,10 @@ class AI:
         self.difficulty = difficulty
         self.MAX_PLAYER = Player.O_PLAYER.value
         self.MIN_PLAYER = Player.X_PLAYER.value
+        # (canonical key, is_max) -> (depth, score, flag); scores depend only on
+        # the position up to symmetry, the side to move and the remaining depth,
+        # so entries stay valid across moves and games.
+        self.transposition_table: dict[tuple[int, bool], tuple[int, float, TTFlag]] = {}
         logger.info(f"AI initialized with difficulty: {difficulty.name}")
 
     def get_move(self, board: Board) -> tuple[int, int]:
@@ -57,7 +223,7 @@ class AI:
     @staticmethod
     def _get_easy_move(board: Board) -> tuple[int, int]:
         """Get a move for easy difficulty (purely random)."""
-        legal_moves = list(board.legal_moves())
+        legal_moves = board.legal_moves()
         move = random.choice(legal_moves)
         logger.debug(f"Easy AI: Random move selected from {len(legal_moves)} options")
         return move
@@ -83,16 +249,30 @@ class AI:
         Returns:
             Tuple of (row, col) for the best move
         """
-        legal_moves = list(board.legal_moves())
+        legal_moves = board.legal_moves()
         best_move = legal_moves[0]
         best_score = NEGATIVE_INFINITY
 
         logger.debug(f"Minimax: Evaluating {len(legal_moves)} moves with depth {depth}")
 
+        if depth >= len(legal_moves):
+            # Deep enough to reach every game end, so the search would return
+            # exact game values: read the move from the perfect-play cache.
+            return _perfect_move(board.x_bb, board.o_bb)
+
+        x_bb = board.x_bb
+        o_bb = board.o_bb
         for move in legal_moves:
-            board.apply(move, self.MAX_PLAYER)
-            score = self.minimax(board, depth, False, NEGATIVE_INFINITY, INFINITY)
-            board.undo(move)
+            row, col = move
+            score = _minimax_bb(
+                x_bb,
+                o_bb | 1 << (row * BOARD_SIZE + col),
+                depth,
+                False,
+                NEGATIVE_INFINITY,
+                INFINITY,
+                self.transposition_table,
+            )
 
             if score > best_score:
                 best_score = score
@@ -109,6 +289,9 @@ class AI:
         """
         Minimax algorithm with alpha-beta pruning.
 
+        Searches through the Board's own methods; move selection uses the
+        bitboard search in _minimax_bb, which returns the same scores.
+
         Args:
             board: Current board state
             depth: Remaining search depth
@@ -119,32 +302,66 @@ class AI:
         Returns:
             Score of the position
         """
-        if board.terminal() or depth == 0:
-            score = board.evaluate()
+        alpha_orig = alpha
+        beta_orig = beta
+        key = (board.canonical_key(), is_max)
+        entry = self.transposition_table.get(key)
+        if entry is not None and entry[0] == depth:
+            _, score, flag = entry
+            if flag is TTFlag.EXACT:
+                return score
+            if flag is TTFlag.LOWERBOUND:
+                alpha = max(alpha, score)
+            else:
+                beta = min(beta, score)
+            if alpha >= beta:
+                return score
+
+        winner, full = board.status()
+        if winner is not None or full or depth == 0:
+            if winner is None:
+                score = board.evaluate()
+            elif winner == self.MAX_PLAYER:
+                score = _WIN
+            else:
+                score = _LOSE
             logger.debug(f"Minimax terminal/depth=0: score={score}, is_max={is_max}")
+            self.transposition_table[key] = (depth, score, TTFlag.EXACT)
             return score
 
-        if is_max:
-            best = NEGATIVE_INFINITY
-            for move in board.legal_moves():
-                board.apply(move, self.MAX_PLAYER)
-                val = self.minimax(board, depth - 1, False, alpha, beta)
-                board.undo(move)
-                best = max(best, val)
-                alpha = max(alpha, best)
-                if alpha >= beta:
-                    logger.debug(f"Alpha-beta pruning: alpha={alpha}, beta={beta}")
-                    break
-            return best
+        with board.without_history():
+            if is_max:
+                best = NEGATIVE_INFINITY
+                for move in _MOVE_ORDER:
+                    if not board.is_valid_move(move):
+                        continue
+                    board.apply(move, self.MAX_PLAYER)
+                    val = self.minimax(board, depth - 1, False, alpha, beta)
+                    board.undo(move)
+                    best = max(best, val)
+                    alpha = max(alpha, best)
+                    if alpha >= beta:
+                        logger.debug(f"Alpha-beta pruning: alpha={alpha}, beta={beta}")
+                        break
+            else:
+                best = INFINITY
+                for move in _MOVE_ORDER:
+                    if not board.is_valid_move(move):
+                        continue
+                    board.apply(move, self.MIN_PLAYER)
+                    val = self.minimax(board, depth - 1, True, alpha, beta)
+                    board.undo(move)
+                    best = min(best, val)
+                    beta = min(beta, best)
+                    if alpha >= beta:
+                        logger.debug(f"Alpha-beta pruning: alpha={alpha}, beta={beta}")
+                        break
+
+        if best <= alpha_orig:
+            flag = TTFlag.UPPERBOUND
+        elif best >= beta_orig:
+            flag = TTFlag.LOWERBOUND
         else:
-            best = INFINITY
-            for move in board.legal_moves():
-                board.apply(move, self.MIN_PLAYER)
-                val = self.minimax(board, depth - 1, True, alpha, beta)
-                board.undo(move)
-                best = min(best, val)
-                beta = min(beta, best)
-                if alpha >= beta:
-                    logger.debug(f"Alpha-beta pruning: alpha={alpha}, beta={beta}")
-                    break
-            return best
+            flag = TTFlag.EXACT
+        self.transposition_table[key] = (depth, best, flag)
+        return best
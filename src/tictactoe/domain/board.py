@@ -3,27 +3,234 @@ Board class for tic-tac-toe game with all game logic methods.
 """
 
 from collections.abc import Iterator
+from contextlib import contextmanager
 
 import numpy as np
 
-from ..consts.board_consts import BOARD_SIZE, Player, Score
+from ..consts.board_consts import BOARD_SIZE, WIN_LINES, Player, Score
 from ..infra.logger import get_logger
 
 logger = get_logger()
 
+_X = Player.X_PLAYER.value
+_O = Player.O_PLAYER.value
+_EMPTY = Player.EMPTY.value
+_WIN = Score.WIN.value
+_LOSE = Score.LOSE.value
+_DRAW = Score.DRAW.value
+
+_WIN_LINE_NAMES = (
+    "row 0",
+    "row 1",
+    "row 2",
+    "column 0",
+    "column 1",
+    "column 2",
+    "main diagonal",
+    "anti-diagonal",
+)
+
+# Bit i of a player's bitboard is set when that player holds cell
+# (i // BOARD_SIZE, i % BOARD_SIZE).
+_CELL_COUNT = BOARD_SIZE * BOARD_SIZE
+_FULL_MASK = (1 << _CELL_COUNT) - 1
+_CELL_COORDS = tuple(divmod(index, BOARD_SIZE) for index in range(_CELL_COUNT))
+# Free-cell bitmask -> the (row, col) of each free cell in row-major order.
+_LEGAL_MOVES = tuple(
+    tuple(_CELL_COORDS[index] for index in range(_CELL_COUNT) if free >> index & 1)
+    for free in range(_FULL_MASK + 1)
+)
+_SYMBOLS = {_EMPTY: " ", _X: "X", _O: "O"}
+# One "{}" per cell: cells separated by " | ", rows by newlines.
+_BOARD_FORMAT = "\n".join([" | ".join(["{}"] * BOARD_SIZE)] * BOARD_SIZE)
+_WIN_MASKS = tuple((1 << a) | (1 << b) | (1 << c) for a, b, c in WIN_LINES)
+# Heuristic weight of a line holding only one player's marks, by mark count.
+_LINE_SCORE = tuple(count * count for count in range(BOARD_SIZE + 1))
+
+# The eight symmetries of the square (rotations and reflections) as maps
+# from a cell's (row, col) to where that cell lands.
+_LAST = BOARD_SIZE - 1
+_SYMMETRIES = (
+    lambda r, c: (r, c),
+    lambda r, c: (c, _LAST - r),
+    lambda r, c: (_LAST - r, _LAST - c),
+    lambda r, c: (_LAST - c, r),
+    lambda r, c: (r, _LAST - c),
+    lambda r, c: (_LAST - r, c),
+    lambda r, c: (c, r),
+    lambda r, c: (_LAST - c, _LAST - r),
+)
+
+
+def _build_symmetry_table(symmetry) -> tuple[int, ...]:
+    """
+    Precompute where one symmetry sends every possible bitboard.
+
+    Args:
+        symmetry: Function mapping (row, col) to the transformed (row, col)
+
+    Returns:
+        Tuple indexed by bitboard giving the transformed bitboard
+    """
+    targets = []
+    for index in range(_CELL_COUNT):
+        row, col = symmetry(*_CELL_COORDS[index])
+        targets.append(1 << (row * BOARD_SIZE + col))
+
+    table = []
+    for bitboard in range(_FULL_MASK + 1):
+        mapped = 0
+        for index, target in enumerate(targets):
+            if bitboard >> index & 1:
+                mapped |= target
+        table.append(mapped)
+    return tuple(table)
+
+
+_SYMMETRY_TABLES = tuple(_build_symmetry_table(sym) for sym in _SYMMETRIES)
+
+
+def find_winner(x_bb: int, o_bb: int) -> int | None:
+    """
+    Find the player who has completed a line on a pair of bitboards.
+
+    Args:
+        x_bb: Bitboard of the cells held by X_PLAYER
+        o_bb: Bitboard of the cells held by O_PLAYER
+
+    Returns:
+        Winner player value (Player enum value as int) or None if no winner
+    """
+    if x_bb.bit_count() < BOARD_SIZE and o_bb.bit_count() < BOARD_SIZE:
+        # Completing a line takes at least three marks from one player.
+        return None
+
+    for line_mask in _WIN_MASKS:
+        if x_bb & line_mask == line_mask:
+            return _X
+        if o_bb & line_mask == line_mask:
+            return _O
+    return None
+
+
+def evaluate_position(x_bb: int, o_bb: int) -> int:
+    """
+    Score a position given as a pair of bitboards.
+
+    Args:
+        x_bb: Bitboard of the cells held by X_PLAYER
+        o_bb: Bitboard of the cells held by O_PLAYER
+
+    Returns:
+        Positive score for O_PLAYER advantage, negative for X_PLAYER advantage, 0 for draw
+    """
+    winner = find_winner(x_bb, o_bb)
+
+    if winner == _O:
+        return _WIN
+    if winner == _X:
+        return _LOSE
+    if (x_bb | o_bb) == _FULL_MASK:
+        return _DRAW
+
+    return line_score(x_bb, o_bb)
+
+
+def line_score(x_bb: int, o_bb: int) -> int:
+    """
+    Heuristic score of an undecided position from its open lines.
+
+    Args:
+        x_bb: Bitboard of the cells held by X_PLAYER
+        o_bb: Bitboard of the cells held by O_PLAYER
+
+    Returns:
+        Sum over lines of the squared mark count, positive for O_PLAYER and
+        negative for X_PLAYER
+    """
+    score = 0
+    for line_mask in _WIN_MASKS:
+        o_count = (o_bb & line_mask).bit_count()
+        x_count = (x_bb & line_mask).bit_count()
+        # A line holding marks from both players can no longer be won.
+        if not x_count:
+            score += _LINE_SCORE[o_count]
+        elif not o_count:
+            score -= _LINE_SCORE[x_count]
+    return score
+
+
+def canonical_key(x_bb: int, o_bb: int) -> int:
+    """
+    Get a key shared by every rotation and reflection of a position.
+
+    Args:
+        x_bb: Bitboard of the cells held by X_PLAYER
+        o_bb: Bitboard of the cells held by O_PLAYER
+
+    Returns:
+        The smallest position key among the eight symmetric boards
+    """
+    return min(table[x_bb] | table[o_bb] << _CELL_COUNT for table in _SYMMETRY_TABLES)
+
 
 class Board:
-    """Represents a 3x3 tic-tac-toe board."""
+    """Represents a 3x3 tic-tac-toe board stored as one bitboard per player."""
 
     def __init__(self) -> None:
         """Initialize an empty 3x3 board."""
-        self.board = np.zeros((BOARD_SIZE, BOARD_SIZE), dtype=int)
+        self.x_bb = 0
+        self.o_bb = 0
         self.move_history: list[tuple[tuple[int, int], int]] = []
+        self.record_history = True
         logger.debug("Board initialized")
 
+    @property
+    def board(self) -> np.ndarray:
+        """
+        The board as a fresh 3x3 int8 array of Player values.
+
+        Returns:
+            Array built from the bitboards; writing to it does not change the board
+        """
+        return np.array(self.cells(), dtype=np.int8).reshape(BOARD_SIZE, BOARD_SIZE)
+
+    def cells(self) -> tuple[int, ...]:
+        """
+        Get every cell value in row-major order.
+
+        Returns:
+            Tuple of nine Player values as ints
+        """
+        x_bb = self.x_bb
+        o_bb = self.o_bb
+        return tuple(
+            _X if x_bb >> index & 1 else _O if o_bb >> index & 1 else _EMPTY
+            for index in range(_CELL_COUNT)
+        )
+
+    def position_key(self) -> int:
+        """
+        Get an integer that uniquely identifies the current position.
+
+        Returns:
+            The X bitboard in the low bits and the O bitboard above it
+        """
+        return self.x_bb | self.o_bb << _CELL_COUNT
+
+    def canonical_key(self) -> int:
+        """
+        Get a key shared by every rotation and reflection of the position.
+
+        Returns:
+            The smallest position key among the eight symmetric boards
+        """
+        return canonical_key(self.x_bb, self.o_bb)
+
     def reset(self) -> None:
         """Reset the board to initial empty state."""
-        self.board = np.zeros((BOARD_SIZE, BOARD_SIZE), dtype=int)
+        self.x_bb = 0
+        self.o_bb = 0
         self.move_history = []
         logger.info("Board reset to initial state")
 
@@ -39,20 +246,23 @@ class Board:
             True if move was valid and applied, False otherwise
         """
         row, col = move
-        player_name = (
-            "X"
-            if player == Player.X_PLAYER.value
-            else "O"
-            if player == Player.O_PLAYER.value
-            else "Unknown"
-        )
+        player_name = "X" if player == _X else "O" if player == _O else "Unknown"
 
         if not self.is_valid_move(move):
             logger.warning(f"Invalid move attempted: {player_name} at ({row}, {col})")
             return False
 
-        self.board[row, col] = player
-        self.move_history.append((move, player))
+        mask = 1 << (row * BOARD_SIZE + col)
+        if player == _X:
+            self.x_bb |= mask
+        elif player == _O:
+            self.o_bb |= mask
+        else:
+            logger.warning(f"Invalid player {player} at ({row}, {col})")
+            return False
+
+        if self.record_history:
+            self.move_history.append((move, player))
         logger.info(f"Move applied: {player_name} at ({row}, {col})")
         return True
 
@@ -68,11 +278,28 @@ class Board:
             logger.warning(f"Invalid undo coordinates: ({row}, {col})")
             return
 
-        self.board[row, col] = Player.EMPTY.value
+        keep = ~(1 << (row * BOARD_SIZE + col))
+        self.x_bb &= keep
+        self.o_bb &= keep
         if self.move_history and self.move_history[-1][0] == move:
             self.move_history.pop()
             logger.debug(f"Move undone at ({row}, {col})")
 
+    @contextmanager
+    def without_history(self) -> Iterator[None]:
+        """
+        Apply and undo moves without recording them, e.g. while searching.
+
+        Returns:
+            Context manager that restores the previous setting on exit
+        """
+        record_history = self.record_history
+        self.record_history = False
+        try:
+            yield
+        finally:
+            self.record_history = record_history
+
     def is_valid_move(self, move: tuple[int, int]) -> bool:
         """
         Check if a move is valid.
@@ -87,19 +314,16 @@ class Board:
         if not (0 <= row < BOARD_SIZE and 0 <= col < BOARD_SIZE):
             return False
 
-        return bool(self.board[row, col] == Player.EMPTY.value)
+        return not (self.x_bb | self.o_bb) >> (row * BOARD_SIZE + col) & 1
 
-    def legal_moves(self) -> Iterator[tuple[int, int]]:
+    def legal_moves(self) -> tuple[tuple[int, int], ...]:
         """
-        Return an iterator of all legal moves.
+        Return all legal moves.
 
         Returns:
-            Iterator of (row, col) tuples for all empty positions
+            Tuple of (row, col) tuples for all empty positions, in row-major order
         """
-        for row in range(BOARD_SIZE):
-            for col in range(BOARD_SIZE):
-                if self.board[row, col] == Player.EMPTY.value:
-                    yield row, col
+        return _LEGAL_MOVES[~(self.x_bb | self.o_bb) & _FULL_MASK]
 
     def terminal(self) -> bool:
         """
@@ -116,56 +340,39 @@ class Board:
                 logger.info("Game reached terminal state: Draw")
         return is_terminal
 
-    def check_winner(self) -> int | None:
+    def status(self) -> tuple[int | None, bool]:
         """
-        Check if there's a winner on the board.
+        Get the winner and whether the board is full in one pass.
 
         Returns:
-            Winner player value (Player enum value as int) or None if no winner
+            Tuple of (winner player value or None, True if every cell is taken)
         """
-        for row in range(BOARD_SIZE):
-            if self._check_line([(row, 0), (row, 1), (row, 2)]):
-                winner = int(self.board[row, 0])
-                winner_name = "X" if winner == Player.X_PLAYER.value else "O"
-                logger.info(f"Winner found: {winner_name} in row {row}")
-                return winner
-
-        for col in range(BOARD_SIZE):
-            if self._check_line([(0, col), (1, col), (2, col)]):
-                winner = int(self.board[0, col])
-                winner_name = "X" if winner == Player.X_PLAYER.value else "O"
-                logger.info(f"Winner found: {winner_name} in column {col}")
-                return winner
-
-        if self._check_line([(0, 0), (1, 1), (2, 2)]):
-            winner = int(self.board[0, 0])
-            winner_name = "X" if winner == Player.X_PLAYER.value else "O"
-            logger.info(f"Winner found: {winner_name} in main diagonal")
-            return winner
-
-        if self._check_line([(0, 2), (1, 1), (2, 0)]):
-            winner = int(self.board[0, 2])
-            winner_name = "X" if winner == Player.X_PLAYER.value else "O"
-            logger.info(f"Winner found: {winner_name} in anti-diagonal")
-            return winner
+        x_bb = self.x_bb
+        o_bb = self.o_bb
+        return find_winner(x_bb, o_bb), (x_bb | o_bb) == _FULL_MASK
 
-        return None
-
-    def _check_line(self, positions: list[tuple[int, int]]) -> bool:
+    def check_winner(self) -> int | None:
         """
-        Check if all positions in a line have the same non-empty value.
-
-        Args:
-            positions: List of (row, col) tuples forming a line
+        Check if there's a winner on the board.
 
         Returns:
-            True if all positions have the same non-empty value
+            Winner player value (Player enum value as int) or None if no winner
         """
-        if len(positions) != 3:
-            return False
+        x_bb = self.x_bb
+        o_bb = self.o_bb
+        if x_bb.bit_count() < BOARD_SIZE and o_bb.bit_count() < BOARD_SIZE:
+            # Completing a line takes at least three marks from one player.
+            return None
+
+        for line_name, line_mask in zip(_WIN_LINE_NAMES, _WIN_MASKS, strict=True):
+            if x_bb & line_mask == line_mask:
+                logger.info(f"Winner found: X in {line_name}")
+                return _X
+            if o_bb & line_mask == line_mask:
+                logger.info(f"Winner found: O in {line_name}")
+                return _O
 
-        values = [self.board[row, col] for row, col in positions]
-        return values[0] != Player.EMPTY.value and values[0] == values[1] == values[2]
+        return None
 
     def is_board_full(self) -> bool:
         """
@@ -174,7 +381,7 @@ class Board:
         Returns:
             True if board is full, False otherwise
         """
-        return bool(np.all(self.board != Player.EMPTY.value))
+        return (self.x_bb | self.o_bb) == _FULL_MASK
 
     def evaluate(self) -> int:
         """
@@ -183,64 +390,7 @@ class Board:
         Returns:
             Positive score for O_PLAYER advantage, negative for X_PLAYER advantage, 0 for draw
         """
-        winner = self.check_winner()
-
-        match winner:
-            case Player.O_PLAYER.value:
-                return Score.WIN.value
-            case Player.X_PLAYER.value:
-                return Score.LOSE.value
-            case None:
-                if self.is_board_full():
-                    return Score.DRAW.value
-
-        score = 0
-
-        lines = [
-            [(0, 0), (0, 1), (0, 2)],
-            [(1, 0), (1, 1), (1, 2)],
-            [(2, 0), (2, 1), (2, 2)],
-            [(0, 0), (1, 0), (2, 0)],
-            [(0, 1), (1, 1), (2, 1)],
-            [(0, 2), (1, 2), (2, 2)],
-            [(0, 0), (1, 1), (2, 2)],
-            [(0, 2), (1, 1), (2, 0)],
-        ]
-
-        for line in lines:
-            line_score = self._evaluate_line(line)
-            score += line_score
-
-        return score
-
-    def _evaluate_line(self, line: list[tuple[int, int]]) -> int:
-        """
-        Evaluate a specific line on the board.
-
-        Args:
-            line: List of (row, col) positions forming a line
-
-        Returns:
-            Score for this line
-        """
-        o_count = 0
-        x_count = 0
-
-        for row, col in line:
-            if self.board[row, col] == Player.O_PLAYER.value:
-                o_count += 1
-            elif self.board[row, col] == Player.X_PLAYER.value:
-                x_count += 1
-
-        if o_count > 0 and x_count > 0:
-            return 0
-
-        if o_count > 0:
-            return o_count * o_count
-        elif x_count > 0:
-            return -x_count * x_count
-
-        return 0
+        return evaluate_position(self.x_bb, self.o_bb)
 
     def get_board_copy(self) -> np.ndarray:
         """
@@ -249,7 +399,7 @@ class Board:
         Returns:
             Deep copy of the board
         """
-        return self.board.copy()
+        return self.board
 
     def get_cell(self, row: int, col: int) -> int:
         """
@@ -263,10 +413,15 @@ class Board:
             Cell value (Player enum value as int)
         """
         if 0 <= row < BOARD_SIZE and 0 <= col < BOARD_SIZE:
-            return int(self.board[row, col])
+            index = row * BOARD_SIZE + col
+            if self.x_bb >> index & 1:
+                return _X
+            if self.o_bb >> index & 1:
+                return _O
+            return _EMPTY
         else:
             logger.warning(f"Invalid cell coordinates: ({row}, {col})")
-            return Player.EMPTY.value
+            return _EMPTY
 
     def make_move(self, row: int, col: int, player: int) -> bool:
         """
@@ -311,12 +466,4 @@ class Board:
 
     def __str__(self) -> str:
         """String representation of the board for debugging."""
-        symbols = {
-            Player.EMPTY.value: " ",
-            Player.X_PLAYER.value: "X",
-            Player.O_PLAYER.value: "O",
-        }
-        lines = []
-        for row in self.board:
-            lines.append(" | ".join(symbols[cell] for cell in row))
-        return "\n".join(lines)
+        return _BOARD_FORMAT.format(*(_SYMBOLS[cell] for cell in self.cells()))
@@ -43,6 +43,7 @@ class LeaderboardRow(NamedTuple):
     ai_hard_wins: int
     win_percentage: float
     total_games: int
+    formatted_stats: tuple[str, ...] = ()
 
 
 class LeaderboardData(NamedTuple):
@@ -49,6 +49,7 @@ class LeaderboardService:
         leaderboard = self.storage.leaderboard(limit)
 
         medals = ["1st", "2nd", "3rd"]
+        formatted_stats = self._format_stat_columns(leaderboard)
         rows = []
 
         for i, player in enumerate(leaderboard):
@@ -66,6 +67,7 @@ class LeaderboardService:
                 ai_hard_wins=player.ai_hard_wins,
                 win_percentage=player.win_percentage,
                 total_games=player.total_games,
+                formatted_stats=formatted_stats[i],
             )
             rows.append(row)
 
@@ -85,6 +87,32 @@ class LeaderboardService:
             title="LEADERBOARD", headers=headers, rows=rows, total_players=len(rows)
         )
 
+    @staticmethod
+    def _format_stat_columns(
+        leaderboard: list[PlayerStats],
+    ) -> list[tuple[str, ...]]:
+        """
+        Format the numeric leaderboard columns for display.
+
+        Args:
+            leaderboard: List of PlayerStats in display order
+
+        Returns:
+            One tuple of display strings per player, in column order
+        """
+        return [
+            (
+                f"{player.total_wins}",
+                f"{player.pvp_wins}",
+                f"{player.ai_easy_wins}",
+                f"{player.ai_medium_wins}",
+                f"{player.ai_hard_wins}",
+                f"{player.win_percentage:.1f}%",
+                f"{player.total_games}",
+            )
+            for player in leaderboard
+        ]
+
     def get_player_rank(self, player_name: str) -> int | None:
         """
         Get the rank of a specific player.
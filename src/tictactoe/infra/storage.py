@@ -3,6 +3,8 @@ SQLite storage for tic-tac-toe leaderboard and match history.
 """
 
 import sqlite3
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
@@ -11,6 +13,10 @@ from .logger import get_logger
 
 logger = get_logger()
 
+# Matches per multi-row INSERT: five bound values each, kept under the
+# 999-parameter limit of SQLite builds older than 3.32.
+_MATCH_INSERT_BATCH = 999 // 5
+
 
 class Storage:
     """SQLite storage manager for tic-tac-toe data."""
@@ -20,17 +26,44 @@ class Storage:
         Initialize storage with database path.
 
         Args:
-            db_path: Path to SQLite database file
+            db_path: Path to SQLite database file, or ":memory:" for a private
+                in-memory database
         """
         self.db_path = Path(db_path)
+        # One connection for the life of the storage: reopening the file for
+        # every query is wasted work, and an in-memory database only lives
+        # as long as its connection. Autocommit mode: writes are grouped by
+        # explicit transactions in _transaction instead of implicit BEGINs.
+        self._conn = sqlite3.connect(self.db_path, isolation_level=None)
         self._init_schema()
         logger.info(f"Storage initialized with database: {self.db_path}")
 
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+        logger.debug(f"Storage closed: {self.db_path}")
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        """
+        Run a block of statements as one explicit transaction.
+
+        Returns:
+            Context manager yielding a cursor; commits when the block finishes
+            and rolls back if it raises
+        """
+        cursor = self._conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            yield cursor
+        except BaseException:
+            self._conn.rollback()
+            raise
+        self._conn.commit()
+
     def _init_schema(self) -> None:
         """Initialize database schema with players and matches tables."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-
+        with self._transaction() as cursor:
             cursor.execute(
                 """
                 CREATE TABLE IF NOT EXISTS players (
@@ -57,7 +90,6 @@ class Storage:
             """
             )
 
-            conn.commit()
             logger.debug("Database schema initialized")
 
     def get_or_create_player_id(self, name: str) -> int:
@@ -67,6 +99,21 @@ class Storage:
         Args:
             name: Player name (will be normalized)
 
+        Returns:
+            Player ID
+        """
+        with self._transaction() as cursor:
+            return self._get_or_create_player_id(cursor, name)
+
+    @staticmethod
+    def _get_or_create_player_id(cursor: sqlite3.Cursor, name: str) -> int:
+        """
+        Get existing player ID or create new player on an open cursor.
+
+        Args:
+            cursor: Cursor of the connection to work in
+            name: Player name (will be normalized)
+
         Returns:
             Player ID
         """
@@ -74,43 +121,49 @@ class Storage:
         if not normalized_name:
             raise ValueError("Player name cannot be empty")
 
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        cursor.execute(
+            "SELECT id FROM players WHERE LOWER(name) = LOWER(?)",
+            (normalized_name,),
+        )
+        result = cursor.fetchone()
 
-            cursor.execute(
-                "SELECT id FROM players WHERE LOWER(name) = LOWER(?)",
-                (normalized_name,),
-            )
-            result = cursor.fetchone()
+        if result:
+            player_id = result[0]
+            logger.debug(f"Found existing player: {normalized_name} (ID: {player_id})")
+            return player_id
 
-            if result:
-                player_id = result[0]
-                logger.debug(
-                    f"Found existing player: {normalized_name} (ID: {player_id})"
-                )
-                return player_id
+        cursor.execute("INSERT INTO players (name) VALUES (?)", (normalized_name,))
+        player_id = cursor.lastrowid
 
-            cursor.execute("INSERT INTO players (name) VALUES (?)", (normalized_name,))
-            player_id = cursor.lastrowid
-            conn.commit()
+        logger.info(f"Created new player: {normalized_name} (ID: {player_id})")
+        return player_id
 
-            logger.info(f"Created new player: {normalized_name} (ID: {player_id})")
-            return player_id
+    @classmethod
+    def _resolve_player_ids(
+        cls, cursor: sqlite3.Cursor, names: Iterable[str]
+    ) -> dict[str, int]:
+        """
+        Get or create the player ID of every distinct name, once each.
 
-    def record_match(
-        self,
-        player_x: str,
-        player_o: str,
-        result: str,
-        mode: str,
-        ai_level: str | None = None,
-    ) -> None:
+        Args:
+            cursor: Cursor of the connection to work in
+            names: Player names as given, repeats allowed
+
+        Returns:
+            Dict mapping each given name to its player ID
         """
-        Record a completed match.
+        player_ids: dict[str, int] = {}
+        for name in names:
+            if name not in player_ids:
+                player_ids[name] = cls._get_or_create_player_id(cursor, name)
+        return player_ids
+
+    @staticmethod
+    def _validate_match(result: str, mode: str, ai_level: str | None) -> None:
+        """
+        Check a match's result, mode and AI level before storing it.
 
         Args:
-            player_x: Name of player X
-            player_o: Name of player O (or "AI" for AI matches)
             result: 'X', 'O', or 'Draw'
             mode: 'pvp' or 'pvai'
             ai_level: 'easy', 'medium', 'hard', or None for PvP
@@ -127,11 +180,29 @@ class Storage:
         if mode == "pvp" and ai_level is not None:
             raise ValueError("AI level should be None for PvP mode")
 
-        player_x_id = self.get_or_create_player_id(player_x)
-        player_o_id = self.get_or_create_player_id(player_o)
+    def record_match(
+        self,
+        player_x: str,
+        player_o: str,
+        result: str,
+        mode: str,
+        ai_level: str | None = None,
+    ) -> None:
+        """
+        Record a completed match.
 
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        Args:
+            player_x: Name of player X
+            player_o: Name of player O (or "AI" for AI matches)
+            result: 'X', 'O', or 'Draw'
+            mode: 'pvp' or 'pvai'
+            ai_level: 'easy', 'medium', 'hard', or None for PvP
+        """
+        self._validate_match(result, mode, ai_level)
+
+        with self._transaction() as cursor:
+            player_x_id = self._get_or_create_player_id(cursor, player_x)
+            player_o_id = self._get_or_create_player_id(cursor, player_o)
 
             cursor.execute(
                 """
@@ -141,12 +212,45 @@ class Storage:
                 (player_x_id, player_o_id, result, mode, ai_level),
             )
 
-            conn.commit()
-
             logger.info(
                 f"Recorded match: {player_x} vs {player_o} → {result} ({mode}/{ai_level or 'N/A'})"
             )
 
+    def record_matches(
+        self, matches: Iterable[tuple[str, str, str, str, str | None]]
+    ) -> None:
+        """
+        Record several completed matches in a single transaction.
+
+        Either every match is stored or, if any of them is invalid, none is.
+
+        Args:
+            matches: (player_x, player_o, result, mode, ai_level) tuples with the
+                same meaning as the arguments of record_match
+        """
+        rows = list(matches)
+        for _, _, result, mode, ai_level in rows:
+            self._validate_match(result, mode, ai_level)
+
+        with self._transaction() as cursor:
+            player_ids = self._resolve_player_ids(
+                cursor, (name for row in rows for name in row[:2])
+            )
+            params = [
+                (player_ids[player_x], player_ids[player_o], result, mode, ai_level)
+                for player_x, player_o, result, mode, ai_level in rows
+            ]
+            for start in range(0, len(params), _MATCH_INSERT_BATCH):
+                batch = params[start : start + _MATCH_INSERT_BATCH]
+                placeholders = ", ".join(["(?, ?, ?, ?, ?)"] * len(batch))
+                cursor.execute(
+                    "INSERT INTO matches (player_x_id, player_o_id, result, mode, ai_level) "
+                    f"VALUES {placeholders}",
+                    [value for row in batch for value in row],
+                )
+
+            logger.info(f"Recorded {len(rows)} matches")
+
     def leaderboard(self, limit: int = 50) -> list[PlayerStats]:
         """
         Get leaderboard data sorted by total wins.
@@ -157,92 +261,77 @@ class Storage:
         Returns:
             List of PlayerStats sorted by total wins (desc), then tie-breakers
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-
-            query = """
-                WITH player_wins AS (
-                    SELECT
-                        p.id,
-                        p.name,
-                        COUNT(CASE
-                            WHEN (m.result = 'X' AND m.player_x_id = p.id) OR
-                                 (m.result = 'O' AND m.player_o_id = p.id)
-                            THEN 1
-                        END) as total_wins,
-                        COUNT(CASE
-                            WHEN ((m.result = 'X' AND m.player_x_id = p.id) OR
-                                  (m.result = 'O' AND m.player_o_id = p.id))
-                                 AND m.mode = 'pvp'
-                            THEN 1
-                        END) as pvp_wins,
-                        COUNT(CASE
-                            WHEN ((m.result = 'X' AND m.player_x_id = p.id) OR
-                                  (m.result = 'O' AND m.player_o_id = p.id))
-                                 AND m.mode = 'pvai' AND m.ai_level = 'easy'
-                            THEN 1
-                        END) as ai_easy_wins,
-                        COUNT(CASE
-                            WHEN ((m.result = 'X' AND m.player_x_id = p.id) OR
-                                  (m.result = 'O' AND m.player_o_id = p.id))
-                                 AND m.mode = 'pvai' AND m.ai_level = 'medium'
-                            THEN 1
-                        END) as ai_medium_wins,
-                        COUNT(CASE
-                            WHEN ((m.result = 'X' AND m.player_x_id = p.id) OR
-                                  (m.result = 'O' AND m.player_o_id = p.id))
-                                 AND m.mode = 'pvai' AND m.ai_level = 'hard'
-                            THEN 1
-                        END) as ai_hard_wins,
-                        COUNT(CASE
-                            WHEN m.player_x_id = p.id OR m.player_o_id = p.id
-                            THEN 1
-                        END) as total_games
-                    FROM players p
-                    LEFT JOIN matches m ON (m.player_x_id = p.id OR m.player_o_id = p.id)
-                    GROUP BY p.id, p.name
-                )
+        query = """
+            WITH player_wins AS (
                 SELECT
-                    name,
-                    total_wins,
-                    pvp_wins,
-                    ai_easy_wins,
-                    ai_medium_wins,
-                    ai_hard_wins,
-                    CASE
-                        WHEN total_games > 0 THEN ROUND(CAST(total_wins AS FLOAT) / total_games * 100, 1)
-                        ELSE 0.0
-                    END as win_percentage,
-                    total_games
-                FROM player_wins
-                WHERE total_games > 0
-                ORDER BY
-                    total_wins DESC,
-                    pvp_wins DESC,
-                    (ai_easy_wins + ai_medium_wins + ai_hard_wins) DESC,
-                    name ASC
-                LIMIT ?
-            """
+                    p.id,
+                    p.name,
+                    COUNT(CASE
+                        WHEN (m.result = 'X' AND m.player_x_id = p.id) OR
+                             (m.result = 'O' AND m.player_o_id = p.id)
+                        THEN 1
+                    END) as total_wins,
+                    COUNT(CASE
+                        WHEN ((m.result = 'X' AND m.player_x_id = p.id) OR
+                              (m.result = 'O' AND m.player_o_id = p.id))
+                             AND m.mode = 'pvp'
+                        THEN 1
+                    END) as pvp_wins,
+                    COUNT(CASE
+                        WHEN ((m.result = 'X' AND m.player_x_id = p.id) OR
+                              (m.result = 'O' AND m.player_o_id = p.id))
+                             AND m.mode = 'pvai' AND m.ai_level = 'easy'
+                        THEN 1
+                    END) as ai_easy_wins,
+                    COUNT(CASE
+                        WHEN ((m.result = 'X' AND m.player_x_id = p.id) OR
+                              (m.result = 'O' AND m.player_o_id = p.id))
+                             AND m.mode = 'pvai' AND m.ai_level = 'medium'
+                        THEN 1
+                    END) as ai_medium_wins,
+                    COUNT(CASE
+                        WHEN ((m.result = 'X' AND m.player_x_id = p.id) OR
+                              (m.result = 'O' AND m.player_o_id = p.id))
+                             AND m.mode = 'pvai' AND m.ai_level = 'hard'
+                        THEN 1
+                    END) as ai_hard_wins,
+                    COUNT(CASE
+                        WHEN m.player_x_id = p.id OR m.player_o_id = p.id
+                        THEN 1
+                    END) as total_games
+                FROM players p
+                LEFT JOIN matches m ON (m.player_x_id = p.id OR m.player_o_id = p.id)
+                GROUP BY p.id, p.name
+            )
+            SELECT
+                name,
+                total_wins,
+                pvp_wins,
+                ai_easy_wins,
+                ai_medium_wins,
+                ai_hard_wins,
+                CASE
+                    WHEN total_games > 0 THEN ROUND(CAST(total_wins AS FLOAT) / total_games * 100, 1)
+                    ELSE 0.0
+                END as win_percentage,
+                total_games
+            FROM player_wins
+            WHERE total_games > 0
+            ORDER BY
+                total_wins DESC,
+                pvp_wins DESC,
+                (ai_easy_wins + ai_medium_wins + ai_hard_wins) DESC,
+                name ASC
+            LIMIT ?
+        """
 
-            cursor.execute(query, (limit,))
-            results = cursor.fetchall()
-
-            leaderboard_data = [
-                PlayerStats(
-                    name=row[0],
-                    total_wins=row[1],
-                    pvp_wins=row[2],
-                    ai_easy_wins=row[3],
-                    ai_medium_wins=row[4],
-                    ai_hard_wins=row[5],
-                    win_percentage=row[6],
-                    total_games=row[7],
-                )
-                for row in results
-            ]
+        results = self._conn.execute(query, (limit,)).fetchall()
 
-            logger.debug(f"Retrieved leaderboard with {len(leaderboard_data)} players")
-            return leaderboard_data
+        # Columns are selected in PlayerStats field order.
+        leaderboard_data = [PlayerStats._make(row) for row in results]
+
+        logger.debug(f"Retrieved leaderboard with {len(leaderboard_data)} players")
+        return leaderboard_data
 
     def recent_matches(
         self, limit: int = 50, filter_mode: str | None = None
@@ -257,115 +346,89 @@ class Storage:
         Returns:
             List of MatchRecord sorted by played_at (desc)
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        base_query = """
+            SELECT
+                m.played_at,
+                px.name as player_x_name,
+                po.name as player_o_name,
+                m.result,
+                m.mode,
+                m.ai_level
+            FROM matches m
+            JOIN players px ON m.player_x_id = px.id
+            JOIN players po ON m.player_o_id = po.id
+        """
 
-            base_query = """
-                SELECT
-                    m.played_at,
-                    px.name as player_x_name,
-                    po.name as player_o_name,
-                    m.result,
-                    m.mode,
-                    m.ai_level
-                FROM matches m
-                JOIN players px ON m.player_x_id = px.id
-                JOIN players po ON m.player_o_id = po.id
-            """
+        where_clause = ""
+        params = []
 
-            where_clause = ""
-            params = []
-
-            if filter_mode == "pvp":
-                where_clause = " WHERE m.mode = 'pvp'"
-            elif filter_mode in ("easy", "medium", "hard"):
-                where_clause = " WHERE m.mode = 'pvai' AND m.ai_level = ?"
-                params.append(filter_mode)
-
-            query = base_query + where_clause + " ORDER BY m.played_at DESC LIMIT ?"
-            params.append(limit)
-
-            cursor.execute(query, params)
-            results = cursor.fetchall()
-
-            match_data = [
-                MatchRecord(
-                    played_at=row[0],
-                    player_x_name=row[1],
-                    player_o_name=row[2],
-                    result=row[3],
-                    mode=row[4],
-                    ai_level=row[5],
-                )
-                for row in results
-            ]
+        if filter_mode == "pvp":
+            where_clause = " WHERE m.mode = 'pvp'"
+        elif filter_mode in ("easy", "medium", "hard"):
+            where_clause = " WHERE m.mode = 'pvai' AND m.ai_level = ?"
+            params.append(filter_mode)
 
-            logger.debug(
-                f"Retrieved {len(match_data)} recent matches (filter: {filter_mode})"
-            )
-            return match_data
+        query = base_query + where_clause + " ORDER BY m.played_at DESC LIMIT ?"
+        params.append(limit)
+
+        results = self._conn.execute(query, params).fetchall()
+
+        # Columns are selected in MatchRecord field order.
+        match_data = [MatchRecord._make(row) for row in results]
+
+        logger.debug(
+            f"Retrieved {len(match_data)} recent matches (filter: {filter_mode})"
+        )
+        return match_data
 
     def reset_data(self) -> None:
         """Reset all data by deleting all matches and players."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-
+        with self._transaction() as cursor:
             cursor.execute("DELETE FROM matches")
             cursor.execute("DELETE FROM players")
 
-            conn.commit()
-
             logger.info("All data reset - matches and players deleted")
 
     def get_stats_summary(self) -> dict[str, Any]:
         """Get overall statistics summary."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-
-            cursor.execute("SELECT COUNT(*) FROM players")
-            total_players = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(*) FROM matches")
-            total_matches = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(*) FROM matches WHERE mode = 'pvp'")
-            pvp_matches = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(*) FROM matches WHERE mode = 'pvai'")
-            pvai_matches = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(*) FROM matches WHERE result = 'Draw'")
-            draws = cursor.fetchone()[0]
+        row = self._conn.execute(
+            """
+            SELECT
+                (SELECT COUNT(*) FROM players),
+                COUNT(*),
+                COALESCE(SUM(mode = 'pvp'), 0),
+                COALESCE(SUM(mode = 'pvai'), 0),
+                COALESCE(SUM(result = 'Draw'), 0)
+            FROM matches
+        """
+        ).fetchone()
+        total_players, total_matches, pvp_matches, pvai_matches, draws = row
 
-            return {
-                "total_players": total_players,
-                "total_matches": total_matches,
-                "pvp_matches": pvp_matches,
-                "pvai_matches": pvai_matches,
-                "draws": draws,
-            }
+        return {
+            "total_players": total_players,
+            "total_matches": total_matches,
+            "pvp_matches": pvp_matches,
+            "pvai_matches": pvai_matches,
+            "draws": draws,
+        }
 
     def _get_all_players(self) -> list[str]:
         """Get all player names (for testing)."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT name FROM players ORDER BY name")
-            return [row[0] for row in cursor.fetchall()]
+        rows = self._conn.execute("SELECT name FROM players ORDER BY name")
+        return [row[0] for row in rows]
 
     def _get_all_matches(self) -> list[str]:
         """Get all matches as strings (for testing)."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT px.name, po.name, m.result, m.mode, m.ai_level, m.played_at
-                FROM matches m
-                JOIN players px ON m.player_x_id = px.id
-                JOIN players po ON m.player_o_id = po.id
-                ORDER BY m.played_at DESC
+        rows = self._conn.execute(
             """
-            )
-            return [
-                f"{row[0]} vs {row[1]}: {row[2]} ({row[3]}/{row[4] or 'N/A'})"
-                for row in cursor.fetchall()
-            ]
+            SELECT px.name, po.name, m.result, m.mode, m.ai_level, m.played_at
+            FROM matches m
+            JOIN players px ON m.player_x_id = px.id
+            JOIN players po ON m.player_o_id = po.id
+            ORDER BY m.played_at DESC
+        """
+        )
+        return [
+            f"{row[0]} vs {row[1]}: {row[2]} ({row[3]}/{row[4] or 'N/A'})"
+            for row in rows
+        ]
@@ -8,6 +8,7 @@ from ..app.scene import Scene
 from ..consts.ai_consts import Difficulty
 from ..consts.board_consts import MatchResult, Player
 from ..consts.scene_consts import SceneTransition
+from ..consts.theme_consts import FontSlot
 from ..domain.ai import AI
 from ..domain.board import Board
 from ..infra.logger import get_logger
@@ -89,6 +90,12 @@ class GameScene(Scene):
             f"Game setup: {mode}, X: {self.player_x_name}, O: {self.player_o_name}"
         )
 
+    def on_enter(self) -> None:
+        """Repaint the whole game view when this scene becomes active again."""
+        super().on_enter()
+        if self.game_ui is not None:
+            self.game_ui.invalidate()
+
     def _on_resize_impl(self, width: int, height: int) -> None:
         """Handle resize implementation."""
         self.layout = compute_layout(width, height)
@@ -97,6 +104,12 @@ class GameScene(Scene):
         if self.game_ui is None:
             self.game_ui = GameUI(self.board, self.layout, self.fonts)
 
+        self._overlay = self._to_display_format(
+            pygame.Surface((width, height)), alpha=False
+        )
+        self._overlay.set_alpha(128)
+        self._overlay.fill((0, 0, 0))
+
     def handle_event(self, event: pygame.event.Event) -> str | None:
         """
         Handle pygame events.
@@ -107,9 +120,10 @@ class GameScene(Scene):
         Returns:
             String indicating scene transition or None if no action needed
         """
-        logger.debug(f"GameScene.handle_event START - event type: {event.type}")
-
-        if event.type == pygame.KEYDOWN:
+        if event.type == pygame.MOUSEMOTION:
+            if self.game_ui is not None:
+                self.game_ui.handle_mouse_motion(event.pos)
+        elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 logger.info("ESC pressed - returning to menu")
                 return SceneTransition.MENU
@@ -130,12 +144,7 @@ class GameScene(Scene):
                     logger.debug(
                         "GameScene.handle_event - game is over, ignoring board click"
                     )
-        elif event.type == pygame.MOUSEMOTION:
-            if self.game_ui is not None:
-                mouse_x, mouse_y = event.pos
-                self.game_ui.handle_mouse_motion((mouse_x, mouse_y))
 
-        logger.debug("GameScene.handle_event END")
         return None
 
     def _handle_board_click(self, mouse_x: int, mouse_y: int) -> None:
@@ -155,7 +164,7 @@ class GameScene(Scene):
 
         row, col = cell
 
-        if self.board.get_cell(row, col) != Player.EMPTY.value:
+        if not self.board.is_valid_move(cell):
             logger.debug(f"Cell ({row}, {col}) is already occupied")
             return
 
@@ -282,23 +291,13 @@ class GameScene(Scene):
         Args:
             surface: Pygame surface to draw on
         """
-        logger.debug(f"GameScene.draw START - surface size: {surface.get_size()}")
-
         if self.game_ui is None:
-            logger.debug("GameScene.draw - game_ui is None, returning")
             return
 
         winner_name = None
         if self.game_over and self.winner:
             winner_name = self.winner
 
-        logger.debug("GameScene.draw - updating GameUI state:")
-        logger.debug(f"  current_player: {self.current_player.value}")
-        logger.debug(f"  game_over: {self.game_over}")
-        logger.debug(f"  player_x_name: {self.player_x_name}")
-        logger.debug(f"  player_o_name: {self.player_o_name}")
-        logger.debug(f"  winner_name: {winner_name}")
-
         self.game_ui.update_game_state(
             board=self.board,
             current_player=self.current_player.value,
@@ -308,15 +307,9 @@ class GameScene(Scene):
             player_o_name=self.player_o_name,
         )
 
-        logger.debug("GameScene.draw - calling game_ui.render")
-        self.game_ui.render(surface)
-
-        if self.game_over:
-            logger.debug("GameScene.draw - calling _draw_game_over_overlay")
+        if self.game_ui.render(surface) and self.game_over:
             self._draw_game_over_overlay(surface)
 
-        logger.debug("GameScene.draw END")
-
     def _draw_game_over_overlay(self, surface: pygame.Surface) -> None:
         """
         Draw game over overlay.
@@ -324,10 +317,7 @@ class GameScene(Scene):
         Args:
             surface: Pygame surface to draw on
         """
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
-        surface.blit(overlay, (0, 0))
+        surface.blit(self._overlay, (0, 0))
 
         if self.winner:
             message = f"{self.winner} wins!"
@@ -336,13 +326,13 @@ class GameScene(Scene):
             message = "It's a draw!"
             color = (200, 200, 200)
 
-        game_over_text = self.fonts["title"].render(message, True, color)
+        game_over_text = self.fonts[FontSlot.TITLE].render(message, True, color)
         game_over_rect = game_over_text.get_rect(
             center=(self.width // 2, self.height // 2 - 50)
         )
         surface.blit(game_over_text, game_over_rect)
 
-        instructions = self.fonts["ui"].render(
+        instructions = self.fonts[FontSlot.UI].render(
             "Click Back to return to menu", True, (255, 255, 255)
         )
         instructions_rect = instructions.get_rect(
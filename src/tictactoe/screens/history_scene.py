@@ -7,6 +7,7 @@ import pygame
 from ..app.scene import Scene
 from ..consts.board_consts import MatchResult
 from ..consts.scene_consts import SceneTransition
+from ..consts.theme_consts import FontSlot
 from ..domain.services.history_service import HistoryService
 from ..infra.logger import get_logger
 from ..infra.storage import Storage
@@ -56,6 +57,9 @@ class MatchHistoryScene(Scene):
         self.header_height = max(35, int(self.layout.font_ui * 1.5))
         self.margin_x = self.layout.safe_margin
 
+        self.back_button_rect = pygame.Rect(20, height - 70, 100, 50)
+        self._back_button_surf = self._build_back_button()
+
     def handle_event(self, event: pygame.event.Event) -> str | None:
         """
         Handle pygame events.
@@ -103,7 +107,9 @@ class MatchHistoryScene(Scene):
         """
         surface.fill(self.bg_color)
 
-        title_text = self.fonts["title"].render("MATCH HISTORY", True, self.title_color)
+        title_text = self.fonts[FontSlot.TITLE].render(
+            "MATCH HISTORY", True, self.title_color
+        )
         title_rect = title_text.get_rect(center=(self.width // 2, self.title_y))
         surface.blit(title_text, title_rect)
 
@@ -117,7 +123,7 @@ class MatchHistoryScene(Scene):
 
         self._draw_back_button(surface)
 
-        instructions = self.fonts["small"].render(
+        instructions = self.fonts[FontSlot.SMALL].render(
             "↑/↓ to scroll • ESC or click Back to return", True, self.header_color
         )
         surface.blit(
@@ -143,7 +149,9 @@ class MatchHistoryScene(Scene):
 
         y = self.table_start_y
         for i, header in enumerate(data.headers):
-            header_text = self.fonts["ui"].render(header, True, self.header_color)
+            header_text = self.fonts[FontSlot.UI].render(
+                header, True, self.header_color
+            )
             surface.blit(header_text, (col_x_positions[i], y))
 
         pygame.draw.line(
@@ -178,33 +186,37 @@ class MatchHistoryScene(Scene):
             col_x_positions: X positions for each column
             y: Y position for the row
         """
-        date_surface = self.fonts["ui"].render(row.date_str, True, self.text_color)
+        date_surface = self.fonts[FontSlot.UI].render(
+            row.date_str, True, self.text_color
+        )
         surface.blit(date_surface, (col_x_positions[0], y))
 
-        time_surface = self.fonts["ui"].render(row.time_str, True, self.text_color)
+        time_surface = self.fonts[FontSlot.UI].render(
+            row.time_str, True, self.text_color
+        )
         surface.blit(time_surface, (col_x_positions[1], y))
 
-        player_x_surface = self.fonts["ui"].render(
+        player_x_surface = self.fonts[FontSlot.UI].render(
             row.player_x_name, True, self.text_color
         )
         surface.blit(player_x_surface, (col_x_positions[2], y))
 
-        vs_surface = self.fonts["ui"].render("vs", True, self.accent_color)
+        vs_surface = self.fonts[FontSlot.UI].render("vs", True, self.accent_color)
         surface.blit(vs_surface, (col_x_positions[3], y))
 
-        player_o_surface = self.fonts["ui"].render(
+        player_o_surface = self.fonts[FontSlot.UI].render(
             row.player_o_name, True, self.text_color
         )
         surface.blit(player_o_surface, (col_x_positions[4], y))
 
         result_color = self._get_result_color(row.result)
-        result_surface = self.fonts["ui"].render(row.result, True, result_color)
+        result_surface = self.fonts[FontSlot.UI].render(row.result, True, result_color)
         surface.blit(result_surface, (col_x_positions[5], y))
 
-        mode_surface = self.fonts["ui"].render(row.mode, True, self.text_color)
+        mode_surface = self.fonts[FontSlot.UI].render(row.mode, True, self.text_color)
         surface.blit(mode_surface, (col_x_positions[6], y))
 
-        ai_level_surface = self.fonts["ui"].render(
+        ai_level_surface = self.fonts[FontSlot.UI].render(
             row.ai_level_display, True, self.text_color
         )
         surface.blit(ai_level_surface, (col_x_positions[7], y))
@@ -260,7 +272,7 @@ class MatchHistoryScene(Scene):
         Args:
             surface: Pygame surface to draw on
         """
-        message = self.fonts["ui"].render(
+        message = self.fonts[FontSlot.UI].render(
             "No matches played yet!", True, self.header_color
         )
         message_rect = message.get_rect(center=(self.width // 2, self.height // 2))
@@ -274,45 +286,36 @@ class MatchHistoryScene(Scene):
             surface: Pygame surface to draw on
             message: Error message to display
         """
-        error_text = self.fonts["ui"].render(message, True, (255, 100, 100))
+        error_text = self.fonts[FontSlot.UI].render(message, True, (255, 100, 100))
         error_rect = error_text.get_rect(center=(self.width // 2, self.height // 2))
         surface.blit(error_text, error_rect)
 
-    def _draw_back_button(self, surface: pygame.Surface) -> None:
+    def _build_back_button(self) -> pygame.Surface:
         """
-        Draw the back button.
+        Composite the back button background, border and label into one surface.
 
-        Args:
-            surface: Pygame surface to draw on
+        Returns:
+            Surface holding the finished back button
         """
-        button_width = 100
-        button_height = 50
-        button_x = 20
-        button_y = self.height - 70
-
-        pygame.draw.rect(
-            surface,
-            (80, 80, 80),
-            (button_x, button_y, button_width, button_height),
-            border_radius=8,
-        )
+        button_surf = pygame.Surface(self.back_button_rect.size, pygame.SRCALPHA)
+        button_rect = button_surf.get_rect()
+        pygame.draw.rect(button_surf, (80, 80, 80), button_rect, border_radius=8)
         pygame.draw.rect(
-            surface,
-            (120, 120, 120),
-            (button_x, button_y, button_width, button_height),
-            width=2,
-            border_radius=8,
+            button_surf, (120, 120, 120), button_rect, width=2, border_radius=8
         )
 
-        back_text = self.fonts["ui"].render("Back", True, self.text_color)
-        text_rect = back_text.get_rect(
-            center=(button_x + button_width // 2, button_y + button_height // 2)
-        )
-        surface.blit(back_text, text_rect)
+        back_text = self.fonts[FontSlot.UI].render("Back", True, self.text_color)
+        button_surf.blit(back_text, back_text.get_rect(center=button_rect.center))
+        return self._to_display_format(button_surf)
 
-        self.back_button_rect = pygame.Rect(
-            button_x, button_y, button_width, button_height
-        )
+    def _draw_back_button(self, surface: pygame.Surface) -> None:
+        """
+        Draw the back button.
+
+        Args:
+            surface: Pygame surface to draw on
+        """
+        surface.blit(self._back_button_surf, self.back_button_rect)
 
     def _is_back_button_clicked(self, mouse_x: int, mouse_y: int) -> bool:
         """
@@ -325,6 +328,4 @@ class MatchHistoryScene(Scene):
         Returns:
             True if back button was clicked
         """
-        return hasattr(self, "back_button_rect") and self.back_button_rect.collidepoint(
-            mouse_x, mouse_y
-        )
+        return self.back_button_rect.collidepoint(mouse_x, mouse_y)
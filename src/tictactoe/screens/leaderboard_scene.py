@@ -6,6 +6,7 @@ import pygame
 
 from ..app.scene import Scene
 from ..consts.scene_consts import SceneTransition
+from ..consts.theme_consts import FontSlot
 from ..domain.services.leaderboard_service import LeaderboardService
 from ..infra.logger import get_logger
 from ..infra.storage import Storage
@@ -52,6 +53,9 @@ class LeaderboardScene(Scene):
         self.header_height = max(40, int(self.layout.font_ui * 1.8))
         self.margin_x = self.layout.safe_margin
 
+        self.back_button_rect = pygame.Rect(20, height - 70, 100, 50)
+        self._back_button_surf = self._build_back_button()
+
     def handle_event(self, event: pygame.event.Event) -> str | None:
         """
         Handle pygame events.
@@ -83,7 +87,9 @@ class LeaderboardScene(Scene):
         """
         surface.fill(self.bg_color)
 
-        title_text = self.fonts["title"].render("LEADERBOARD", True, self.title_color)
+        title_text = self.fonts[FontSlot.TITLE].render(
+            "LEADERBOARD", True, self.title_color
+        )
         title_rect = title_text.get_rect(center=(self.width // 2, self.title_y))
         surface.blit(title_text, title_rect)
 
@@ -96,7 +102,7 @@ class LeaderboardScene(Scene):
 
         self._draw_back_button(surface)
 
-        instructions = self.fonts["small"].render(
+        instructions = self.fonts[FontSlot.SMALL].render(
             "Press ESC or click Back to return to menu", True, self.header_color
         )
         surface.blit(
@@ -121,9 +127,11 @@ class LeaderboardScene(Scene):
             col_x_positions.append(col_x_positions[-1] + width)
 
         y = self.table_start_y
-        for i, header in enumerate(data.headers):
-            header_text = self.fonts["ui"].render(header, True, self.header_color)
-            surface.blit(header_text, (col_x_positions[i], y))
+        font = self.fonts[FontSlot.UI]
+        blit_sequence = [
+            (font.render(header, True, self.header_color), (col_x_positions[i], y))
+            for i, header in enumerate(data.headers)
+        ]
 
         pygame.draw.line(
             surface,
@@ -136,41 +144,33 @@ class LeaderboardScene(Scene):
         y += self.header_height + 10
 
         for row in data.rows:
-            self._draw_leaderboard_row(surface, row, col_x_positions, y)
+            blit_sequence.extend(self._leaderboard_row_blits(row, col_x_positions, y))
             y += self.row_height
 
-    def _draw_leaderboard_row(
-        self, surface: pygame.Surface, row, col_x_positions: list, y: int
-    ) -> None:
+        surface.blits(blit_sequence, doreturn=False)
+
+    def _leaderboard_row_blits(
+        self, row, col_x_positions: list, y: int
+    ) -> list[tuple[pygame.Surface, tuple[int, int]]]:
         """
-        Draw a single leaderboard row.
+        Build the (surface, position) pairs for a single leaderboard row.
 
         Args:
-            surface: Pygame surface to draw on
             row: LeaderboardRow data
             col_x_positions: X positions for each column
             y: Y position for the row
+
+        Returns:
+            List of (surface, position) pairs ready for Surface.blits
         """
-        rank_text = row.medal if row.medal else str(row.rank)
-        rank_surface = self.fonts["ui"].render(rank_text, True, self.text_color)
-        surface.blit(rank_surface, (col_x_positions[0], y))
-
-        name_surface = self.fonts["ui"].render(row.name, True, self.text_color)
-        surface.blit(name_surface, (col_x_positions[1], y))
-
-        stats = [
-            str(row.total_wins),
-            str(row.pvp_wins),
-            str(row.ai_easy_wins),
-            str(row.ai_medium_wins),
-            str(row.ai_hard_wins),
-            f"{row.win_percentage:.1f}%",
-            str(row.total_games),
-        ]
+        font = self.fonts[FontSlot.UI]
+        cells = [row.medal if row.medal else str(row.rank), row.name]
+        cells.extend(row.formatted_stats)
 
-        for i, stat in enumerate(stats):
-            stat_surface = self.fonts["ui"].render(stat, True, self.text_color)
-            surface.blit(stat_surface, (col_x_positions[i + 2], y))
+        return [
+            (font.render(cell, True, self.text_color), (col_x_positions[i], y))
+            for i, cell in enumerate(cells)
+        ]
 
     def _draw_no_data_message(self, surface: pygame.Surface) -> None:
         """
@@ -179,7 +179,7 @@ class LeaderboardScene(Scene):
         Args:
             surface: Pygame surface to draw on
         """
-        message = self.fonts["ui"].render(
+        message = self.fonts[FontSlot.UI].render(
             "No games played yet!", True, self.header_color
         )
         message_rect = message.get_rect(center=(self.width // 2, self.height // 2))
@@ -193,45 +193,36 @@ class LeaderboardScene(Scene):
             surface: Pygame surface to draw on
             message: Error message to display
         """
-        error_text = self.fonts["ui"].render(message, True, (255, 100, 100))
+        error_text = self.fonts[FontSlot.UI].render(message, True, (255, 100, 100))
         error_rect = error_text.get_rect(center=(self.width // 2, self.height // 2))
         surface.blit(error_text, error_rect)
 
-    def _draw_back_button(self, surface: pygame.Surface) -> None:
+    def _build_back_button(self) -> pygame.Surface:
         """
-        Draw the back button.
+        Composite the back button background, border and label into one surface.
 
-        Args:
-            surface: Pygame surface to draw on
+        Returns:
+            Surface holding the finished back button
         """
-        button_width = 100
-        button_height = 50
-        button_x = 20
-        button_y = self.height - 70
-
+        button_surf = pygame.Surface(self.back_button_rect.size, pygame.SRCALPHA)
+        button_rect = button_surf.get_rect()
+        pygame.draw.rect(button_surf, (80, 80, 80), button_rect, border_radius=8)
         pygame.draw.rect(
-            surface,
-            (80, 80, 80),
-            (button_x, button_y, button_width, button_height),
-            border_radius=8,
-        )
-        pygame.draw.rect(
-            surface,
-            (120, 120, 120),
-            (button_x, button_y, button_width, button_height),
-            width=2,
-            border_radius=8,
+            button_surf, (120, 120, 120), button_rect, width=2, border_radius=8
         )
 
-        back_text = self.fonts["ui"].render("Back", True, self.text_color)
-        text_rect = back_text.get_rect(
-            center=(button_x + button_width // 2, button_y + button_height // 2)
-        )
-        surface.blit(back_text, text_rect)
+        back_text = self.fonts[FontSlot.UI].render("Back", True, self.text_color)
+        button_surf.blit(back_text, back_text.get_rect(center=button_rect.center))
+        return self._to_display_format(button_surf)
 
-        self.back_button_rect = pygame.Rect(
-            button_x, button_y, button_width, button_height
-        )
+    def _draw_back_button(self, surface: pygame.Surface) -> None:
+        """
+        Draw the back button.
+
+        Args:
+            surface: Pygame surface to draw on
+        """
+        surface.blit(self._back_button_surf, self.back_button_rect)
 
     def _is_back_button_clicked(self, mouse_x: int, mouse_y: int) -> bool:
         """
@@ -244,6 +235,4 @@ class LeaderboardScene(Scene):
         Returns:
             True if back button was clicked
         """
-        return hasattr(self, "back_button_rect") and self.back_button_rect.collidepoint(
-            mouse_x, mouse_y
-        )
+        return self.back_button_rect.collidepoint(mouse_x, mouse_y)
@@ -6,19 +6,90 @@ from collections.abc import Callable
 
 import pygame
 
-from ..app.scene import Scene
+from ..app.scene import MENU_BLOCKED_EVENTS, Scene
 from ..consts.ai_consts import Difficulty
 from ..consts.scene_consts import SceneTransition
+from ..consts.theme_consts import FontSlot
 from ..infra.logger import get_logger
 from ..infra.storage import Storage
 from ..ui.layout import compute_layout, make_fonts
 
 logger = get_logger()
 
+_DIFFICULTIES: tuple[Difficulty, ...] = tuple(Difficulty)
+_DIFFICULTY_LABELS = (
+    "Easy - Random moves",
+    "Medium - Smart moves",
+    "Hard - Optimal play",
+)
+
 
 class MainMenuScene(Scene):
     """Pygame scene for the main menu with input fields and buttons."""
 
+    blocked_events = MENU_BLOCKED_EVENTS
+
+    __slots__ = (
+        "storage",
+        "play_pvp_callback",
+        "play_vs_ai_callback",
+        "show_leaderboard_callback",
+        "show_history_callback",
+        "reset_data_callback",
+        "quit_game_callback",
+        "player_x_name",
+        "player_o_name",
+        "ai_difficulty",
+        "selected_difficulty_index",
+        "active_input",
+        "cursor_visible",
+        "_last_blink",
+        "_dispatch",
+        "fonts",
+        "bg_color",
+        "title_color",
+        "text_color",
+        "input_color",
+        "input_border_color",
+        "input_active_color",
+        "button_color",
+        "button_hover_color",
+        "button_text_color",
+        "accent_color",
+        "title_y",
+        "content_start_y",
+        "input_width",
+        "input_height",
+        "input_spacing",
+        "button_width",
+        "button_height",
+        "button_spacing",
+        "input_x",
+        "button_x",
+        "rects",
+        "_rect_names",
+        "_rect_list",
+        "_static_text",
+        "_button_surfaces",
+        "_button_rects",
+        "_button_blit_list",
+        "_hover_blit_list",
+        "_static_layer",
+        "_name_surf",
+        "_difficulty_surfaces",
+    )
+
+    _CURSOR_BLINK_MS = 500
+
+    _BUTTONS = (
+        ("pvp", "Play 1 vs 1", (0, 150, 0), (0, 200, 0)),
+        ("pvai", "Play vs AI", (0, 100, 200), (0, 150, 255)),
+        ("leaderboard", "Leaderboard", (200, 150, 0), (255, 200, 0)),
+        ("history", "Match History", (200, 150, 0), (255, 200, 0)),
+        ("reset", "Reset Data", (200, 50, 50), (255, 100, 100)),
+        ("quit", "Quit", (100, 100, 100), (150, 150, 150)),
+    )
+
     def __init__(self, storage: Storage, width: int = 1000, height: int = 1100) -> None:
         """
         Initialize main menu scene.
@@ -44,8 +115,17 @@ class MainMenuScene(Scene):
         self.selected_difficulty_index = 1
 
         self.active_input = None
-        self.cursor_blink_time = 0
         self.cursor_visible = True
+        self._last_blink = 0
+
+        self._dispatch: dict[str, Callable[[], str | None]] = {
+            "pvp": self._start_pvp_game,
+            "pvai": self._start_pvai_game,
+            "leaderboard": self._show_leaderboard,
+            "history": self._show_history,
+            "reset": self._show_reset,
+            "quit": self._quit_game,
+        }
 
         self._on_resize_impl(width, height)
 
@@ -98,6 +178,139 @@ class MainMenuScene(Scene):
         self.input_x = (self.width - self.input_width) // 2
         self.button_x = (self.width - self.button_width) // 2
 
+        secondary_width = 150
+        secondary_x = (self.width - secondary_width) // 2
+        buttons_y = self.content_start_y + 200
+        button_step = self.button_height + self.button_spacing
+
+        self.rects = {
+            "player_x": pygame.Rect(
+                self.input_x, self.content_start_y, self.input_width, self.input_height
+            ),
+            "player_o": pygame.Rect(
+                self.input_x,
+                self.content_start_y + self.input_spacing,
+                self.input_width,
+                self.input_height,
+            ),
+            "difficulty": pygame.Rect(
+                self.input_x,
+                self.content_start_y + 2 * self.input_spacing,
+                self.input_width,
+                self.input_height,
+            ),
+            "pvp": pygame.Rect(
+                self.button_x, buttons_y, self.button_width, self.button_height
+            ),
+            "pvai": pygame.Rect(
+                self.button_x,
+                buttons_y + button_step,
+                self.button_width,
+                self.button_height,
+            ),
+            "leaderboard": pygame.Rect(
+                secondary_x,
+                buttons_y + 2 * button_step,
+                secondary_width,
+                self.button_height,
+            ),
+            "history": pygame.Rect(
+                secondary_x,
+                buttons_y + 3 * button_step,
+                secondary_width,
+                self.button_height,
+            ),
+            "reset": pygame.Rect(
+                secondary_x,
+                buttons_y + 4 * button_step,
+                secondary_width,
+                self.button_height,
+            ),
+            "quit": pygame.Rect(
+                secondary_x,
+                buttons_y + 5 * button_step,
+                secondary_width,
+                self.button_height,
+            ),
+        }
+        self._rect_names = tuple(self.rects)
+        self._rect_list = list(self.rects.values())
+
+        self._static_text = self._render_static_text()
+        self._button_surfaces = self._render_buttons()
+        self._button_rects = [self.rects[key] for key, *_ in self._BUTTONS]
+        self._button_blit_list = [
+            (self._button_surfaces[key], self.rects[key].topleft)
+            for key, *_ in self._BUTTONS
+        ]
+        self._hover_blit_list = [
+            (self._button_surfaces[f"{key}_hover"], self.rects[key].topleft)
+            for key, *_ in self._BUTTONS
+        ]
+        self._static_layer = self._build_static_layer()
+
+        self._name_surf: dict[str, pygame.Surface | None] = {
+            "player_x": None,
+            "player_o": None,
+        }
+        self._invalidate_name("player_x")
+        self._invalidate_name("player_o")
+        self._difficulty_surfaces = [
+            self._to_display_format(
+                self.fonts[FontSlot.UI].render(label, True, self.text_color)
+            )
+            for label in _DIFFICULTY_LABELS
+        ]
+
+    def _invalidate_name(self, key: str) -> None:
+        """
+        Re-render the cached text surface for a player name input.
+
+        Args:
+            key: Input key ("player_x" or "player_o")
+        """
+        value = self.player_x_name if key == "player_x" else self.player_o_name
+        self._name_surf[key] = self._to_display_format(
+            self.fonts[FontSlot.UI].render(value, True, self.text_color)
+        )
+
+    def _render_static_text(self) -> dict[str, pygame.Surface]:
+        """
+        Pre-render every text surface that does not change between frames.
+
+        Returns:
+            Dictionary mapping text keys to rendered surfaces
+        """
+        static_text = {
+            "title": self.fonts[FontSlot.TITLE].render(
+                "TIC TAC TOE", True, self.title_color
+            ),
+            "instructions": self.fonts[FontSlot.SMALL].render(
+                "TAB to switch fields • ENTER to start PvP • ESC to quit",
+                True,
+                self.text_color,
+            ),
+        }
+
+        for label in ("Player X Name:", "Player O Name:", "AI Difficulty:"):
+            static_text[label] = self.fonts[FontSlot.UI].render(
+                label, True, self.text_color
+            )
+
+        for caption in (
+            "Play 1 vs 1",
+            "Play vs AI",
+            "Leaderboard",
+            "Match History",
+            "Reset Data",
+            "Quit",
+        ):
+            static_text[caption] = self.fonts[FontSlot.UI].render(
+                caption, True, self.button_text_color
+            )
+
+        return {key: self._to_display_format(text) for key, text in static_text.items()}
+
     def handle_event(self, event: pygame.event.Event) -> str | None:
         """
         Handle pygame events.
@@ -111,9 +324,7 @@ class MainMenuScene(Scene):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 logger.info("ESC pressed - quitting game")
-                if self.quit_game_callback:
-                    self.quit_game_callback()
-                return "quit"
+                return self._quit_game()
             elif event.key == pygame.K_TAB:
                 if self.active_input == "player_x":
                     self.active_input = "player_o"
@@ -127,15 +338,19 @@ class MainMenuScene(Scene):
                 if event.key == pygame.K_BACKSPACE:
                     if self.active_input == "player_x":
                         self.player_x_name = self.player_x_name[:-1]
+                        self._invalidate_name("player_x")
                     elif self.active_input == "player_o":
                         self.player_o_name = self.player_o_name[:-1]
+                        self._invalidate_name("player_o")
                 elif event.unicode.isprintable() and len(event.unicode) == 1:
                     if self.active_input == "player_x" and len(self.player_x_name) < 20:
                         self.player_x_name += event.unicode
+                        self._invalidate_name("player_x")
                     elif (
                         self.active_input == "player_o" and len(self.player_o_name) < 20
                     ):
                         self.player_o_name += event.unicode
+                        self._invalidate_name("player_o")
 
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:
@@ -143,9 +358,8 @@ class MainMenuScene(Scene):
                 return self._handle_mouse_click(mouse_x, mouse_y)
 
         elif event.type == pygame.MOUSEWHEEL:
-            if self._is_difficulty_area_clicked(
-                pygame.mouse.get_pos()[0], pygame.mouse.get_pos()[1]
-            ):
+            mouse_x, mouse_y = pygame.mouse.get_pos()
+            if self.rects["difficulty"].collidepoint(mouse_x, mouse_y):
                 if event.y > 0:
                     self.selected_difficulty_index = (
                         self.selected_difficulty_index - 1
@@ -154,66 +368,72 @@ class MainMenuScene(Scene):
                     self.selected_difficulty_index = (
                         self.selected_difficulty_index + 1
                     ) % 3
-                self.ai_difficulty = list(Difficulty)[self.selected_difficulty_index]
+                self.ai_difficulty = _DIFFICULTIES[self.selected_difficulty_index]
 
         return None
 
     def _handle_mouse_click(self, mouse_x: int, mouse_y: int) -> str | None:
         """Handle mouse click events."""
-        if self._is_player_x_input_clicked(mouse_x, mouse_y):
-            self.active_input = "player_x"
-        elif self._is_player_o_input_clicked(mouse_x, mouse_y):
-            self.active_input = "player_o"
-        elif self._is_difficulty_area_clicked(mouse_x, mouse_y):
+        hit = pygame.Rect(mouse_x, mouse_y, 1, 1).collidelist(self._rect_list)
+        name = self._rect_names[hit] if hit != -1 else None
+
+        if name in ("player_x", "player_o"):
+            self.active_input = name
+        elif name == "difficulty":
             self.active_input = None
             self.selected_difficulty_index = (self.selected_difficulty_index + 1) % 3
-            self.ai_difficulty = list(Difficulty)[self.selected_difficulty_index]
+            self.ai_difficulty = _DIFFICULTIES[self.selected_difficulty_index]
         else:
             self.active_input = None
 
-        if self._is_play_pvp_button_clicked(mouse_x, mouse_y):
-            return self._start_pvp_game()
-        elif self._is_play_vs_ai_button_clicked(mouse_x, mouse_y):
-            return self._start_pvai_game()
-        elif self._is_leaderboard_button_clicked(mouse_x, mouse_y):
-            if self.show_leaderboard_callback:
-                self.show_leaderboard_callback()
-            return "leaderboard"
-        elif self._is_history_button_clicked(mouse_x, mouse_y):
-            if self.show_history_callback:
-                self.show_history_callback()
-            return "history"
-        elif self._is_reset_button_clicked(mouse_x, mouse_y):
-            if self.reset_data_callback:
-                self.reset_data_callback()
-            return "reset"
-        elif self._is_quit_button_clicked(mouse_x, mouse_y):
-            if self.quit_game_callback:
-                self.quit_game_callback()
-            return "quit"
-
-        return None
+        action = self._dispatch.get(name)
+        return action() if action else None
+
+    def _show_leaderboard(self) -> str:
+        """Switch to the leaderboard scene."""
+        if self.show_leaderboard_callback:
+            self.show_leaderboard_callback()
+        return SceneTransition.LEADERBOARD
+
+    def _show_history(self) -> str:
+        """Switch to the match history scene."""
+        if self.show_history_callback:
+            self.show_history_callback()
+        return SceneTransition.HISTORY
+
+    def _show_reset(self) -> str:
+        """Switch to the reset confirmation scene."""
+        if self.reset_data_callback:
+            self.reset_data_callback()
+        return SceneTransition.RESET
+
+    def _quit_game(self) -> str:
+        """Quit the game."""
+        if self.quit_game_callback:
+            self.quit_game_callback()
+        return SceneTransition.QUIT
 
     def _start_pvp_game(self) -> str | None:
         """Start PvP game with current input values."""
-        if not self.player_x_name.strip() or not self.player_o_name.strip():
+        player_x = self.player_x_name.strip()
+        player_o = self.player_o_name.strip()
+        if not player_x or not player_o:
             logger.warning("Player names cannot be empty")
             return None
 
-        if self.player_x_name.strip() == self.player_o_name.strip():
+        if player_x == player_o:
             logger.warning("Player names must be different")
             return None
 
         logger.info(f"Starting PvP game: {self.player_x_name} vs {self.player_o_name}")
         if self.play_pvp_callback:
-            self.play_pvp_callback(
-                self.player_x_name.strip(), self.player_o_name.strip()
-            )
+            self.play_pvp_callback(player_x, player_o)
         return SceneTransition.GAME
 
     def _start_pvai_game(self) -> str | None:
         """Start PvAI game with current input values."""
-        if not self.player_x_name.strip():
+        player_x = self.player_x_name.strip()
+        if not player_x:
             logger.warning("Player name cannot be empty")
             return None
 
@@ -221,279 +441,143 @@ class MainMenuScene(Scene):
             f"Starting PvAI game: {self.player_x_name} vs AI ({self.ai_difficulty.value})"
         )
         if self.play_vs_ai_callback:
-            self.play_vs_ai_callback(
-                self.player_x_name.strip(), self.ai_difficulty.value
-            )
+            self.play_vs_ai_callback(player_x, self.ai_difficulty.value)
         return SceneTransition.GAME
 
-    def draw(self, surface: pygame.Surface) -> None:
+    def _build_static_layer(self) -> pygame.Surface:
         """
-        Draw the main menu scene.
+        Pre-compose everything that does not change between frames.
 
-        Args:
-            surface: Pygame surface to draw on
+        Returns:
+            Display-format surface with background, title, input frames,
+            buttons and instructions already drawn
         """
-        surface.fill(self.bg_color)
-
-        self.cursor_blink_time += 1
-        if self.cursor_blink_time >= 30:
-            self.cursor_visible = not self.cursor_visible
-            self.cursor_blink_time = 0
+        layer = self._to_display_format(
+            pygame.Surface((self.width, self.height)), alpha=False
+        )
+        layer.fill(self.bg_color)
 
-        title_text = self.fonts["title"].render("TIC TAC TOE", True, self.title_color)
+        title_text = self._static_text["title"]
         title_rect = title_text.get_rect(center=(self.width // 2, self.title_y))
-        surface.blit(title_text, title_rect)
+        layer.blit(title_text, title_rect)
 
-        self._draw_input_fields(surface)
+        self._draw_input_frame(layer, "Player X Name:", self.rects["player_x"])
+        self._draw_input_frame(layer, "Player O Name:", self.rects["player_o"])
+        self._draw_input_frame(layer, "AI Difficulty:", self.rects["difficulty"])
 
-        self._draw_buttons(surface)
+        self._draw_buttons(layer)
 
-        instructions = self.fonts["small"].render(
-            "TAB to switch fields • ENTER to start PvP • ESC to quit",
-            True,
-            self.text_color,
-        )
-        surface.blit(
+        instructions = self._static_text["instructions"]
+        layer.blit(
             instructions, (self.width - instructions.get_width() - 20, self.height - 30)
         )
+        return layer
 
-    def _draw_input_fields(self, surface: pygame.Surface) -> None:
-        """Draw input fields for player names and AI difficulty."""
-        y = self.content_start_y
-
-        self._draw_input_field(
-            surface,
-            "Player X Name:",
-            self.player_x_name,
-            self.input_x,
-            y,
-            self.active_input == "player_x",
-        )
-        y += self.input_spacing
-
-        self._draw_input_field(
-            surface,
-            "Player O Name:",
-            self.player_o_name,
-            self.input_x,
-            y,
-            self.active_input == "player_o",
-        )
-        y += self.input_spacing
-
-        self._draw_difficulty_selector(surface, "AI Difficulty:", y)
-
-    def _draw_input_field(
-        self,
-        surface: pygame.Surface,
-        label: str,
-        value: str,
-        x: int,
-        y: int,
-        active: bool,
-    ) -> None:
-        """Draw a single input field."""
-        label_text = self.fonts["ui"].render(label, True, self.text_color)
-        surface.blit(label_text, (x - label_text.get_width() - 20, y + 10))
-
-        border_color = self.input_active_color if active else self.input_border_color
-        pygame.draw.rect(
-            surface, self.input_color, (x, y, self.input_width, self.input_height)
-        )
-        pygame.draw.rect(
-            surface, border_color, (x, y, self.input_width, self.input_height), width=2
-        )
-
-        text_surface = self.fonts["ui"].render(value, True, self.text_color)
-        surface.blit(text_surface, (x + 10, y + 10))
-
-        if active and self.cursor_visible:
-            cursor_x = x + 10 + text_surface.get_width()
-            pygame.draw.line(
-                surface,
-                self.text_color,
-                (cursor_x, y + 5),
-                (cursor_x, y + self.input_height - 5),
-                2,
-            )
-
-    def _draw_difficulty_selector(
-        self, surface: pygame.Surface, label: str, y: int
-    ) -> None:
-        """Draw AI difficulty selector."""
-        label_text = self.fonts["ui"].render(label, True, self.text_color)
-        surface.blit(label_text, (self.input_x - label_text.get_width() - 20, y + 10))
-
-        pygame.draw.rect(
-            surface,
-            self.input_color,
-            (self.input_x, y, self.input_width, self.input_height),
-        )
-        pygame.draw.rect(
-            surface,
-            self.input_border_color,
-            (self.input_x, y, self.input_width, self.input_height),
-            width=2,
-        )
+    def draw(self, surface: pygame.Surface) -> None:
+        """
+        Draw the main menu scene.
 
-        difficulty_text = f"{self.ai_difficulty.value.title()} - {'Random moves' if self.ai_difficulty == Difficulty.EASY else 'Smart moves' if self.ai_difficulty == Difficulty.MEDIUM else 'Optimal play'}"
-        text_surface = self.fonts["ui"].render(difficulty_text, True, self.text_color)
-        surface.blit(text_surface, (self.input_x + 10, y + 10))
+        Args:
+            surface: Pygame surface to draw on
+        """
+        now = pygame.time.get_ticks()
+        if now - self._last_blink >= self._CURSOR_BLINK_MS:
+            self.cursor_visible = not self.cursor_visible
+            self._last_blink = now
 
-    def _draw_buttons(self, surface: pygame.Surface) -> None:
-        """Draw action buttons."""
-        y = self.content_start_y + 200
+        surface.blit(self._static_layer, (0, 0))
 
-        self._draw_button(
-            surface, "Play 1 vs 1", self.button_x, y, (0, 150, 0), (0, 200, 0)
-        )
-        y += self.button_height + self.button_spacing
+        self._draw_input_fields(surface)
 
-        self._draw_button(
-            surface, "Play vs AI", self.button_x, y, (0, 100, 200), (0, 150, 255)
+        hovered = pygame.Rect(pygame.mouse.get_pos(), (1, 1)).collidelist(
+            self._button_rects
         )
-        y += self.button_height + self.button_spacing
+        if hovered != -1:
+            surface.blit(*self._hover_blit_list[hovered])
 
-        secondary_width = 150
-        secondary_x = (self.width - secondary_width) // 2
+    def _draw_input_fields(self, surface: pygame.Surface) -> None:
+        """Draw the contents of the player name and AI difficulty inputs."""
+        for key in ("player_x", "player_o"):
+            rect = self.rects[key]
+            surface.blit(self._name_surf[key], (rect.x + 10, rect.y + 10))
 
-        self._draw_button(
-            surface,
-            "Leaderboard",
-            secondary_x,
-            y,
-            (200, 150, 0),
-            (255, 200, 0),
-            secondary_width,
-        )
-        y += self.button_height + self.button_spacing
+        if self.active_input is not None:
+            self._draw_active_input(surface, self.active_input)
 
-        self._draw_button(
-            surface,
-            "Match History",
-            secondary_x,
-            y,
-            (200, 150, 0),
-            (255, 200, 0),
-            secondary_width,
+        difficulty_rect = self.rects["difficulty"]
+        surface.blit(
+            self._difficulty_surfaces[self.selected_difficulty_index],
+            (difficulty_rect.x + 10, difficulty_rect.y + 10),
         )
-        y += self.button_height + self.button_spacing
 
-        self._draw_button(
-            surface,
-            "Reset Data",
-            secondary_x,
-            y,
-            (200, 50, 50),
-            (255, 100, 100),
-            secondary_width,
-        )
-        y += self.button_height + self.button_spacing
+    def _draw_input_frame(
+        self, surface: pygame.Surface, label: str, rect: pygame.Rect
+    ) -> None:
+        """Draw an input field's label, background and idle border."""
+        label_text = self._static_text[label]
+        surface.blit(label_text, (rect.x - label_text.get_width() - 20, rect.y + 10))
+
+        pygame.draw.rect(surface, self.input_color, rect)
+        pygame.draw.rect(surface, self.input_border_color, rect, width=2)
+
+    def _draw_active_input(self, surface: pygame.Surface, key: str) -> None:
+        """Draw the highlighted border and blinking cursor of the focused input."""
+        rect = self.rects[key]
+        # Blits are not allowed on a locked surface, so only this run of
+        # draw primitives holds the lock.
+        must_lock = surface.mustlock()
+        if must_lock:
+            surface.lock()
+        try:
+            if self.input_active_color != self.input_border_color:
+                pygame.draw.rect(surface, self.input_active_color, rect, width=2)
+
+            if self.cursor_visible:
+                cursor_x = rect.x + 10 + self._name_surf[key].get_width()
+                pygame.draw.line(
+                    surface,
+                    self.text_color,
+                    (cursor_x, rect.y + 5),
+                    (cursor_x, rect.y + self.input_height - 5),
+                    2,
+                )
+        finally:
+            if must_lock:
+                surface.unlock()
+
+    def _render_buttons(self) -> dict[str, pygame.Surface]:
+        """
+        Pre-render every button in its normal and hovered state.
 
-        self._draw_button(
-            surface,
-            "Quit",
-            secondary_x,
-            y,
-            (100, 100, 100),
-            (150, 150, 150),
-            secondary_width,
-        )
+        Returns:
+            Dictionary mapping rect keys (and "<key>_hover") to surfaces
+        """
+        buttons = {}
+        for key, caption, bg_color, border_color in self._BUTTONS:
+            size = self.rects[key].size
+            buttons[key] = self._render_button(caption, size, bg_color, border_color)
+            buttons[f"{key}_hover"] = self._render_button(
+                caption, size, border_color, self.text_color
+            )
+        return buttons
 
-    def _draw_button(
+    def _render_button(
         self,
-        surface: pygame.Surface,
-        text: str,
-        x: int,
-        y: int,
+        caption: str,
+        size: tuple[int, int],
         bg_color: tuple,
         border_color: tuple,
-        width: int = None,
-    ) -> None:
-        """Draw a button."""
-        if width is None:
-            width = self.button_width
-
-        pygame.draw.rect(
-            surface, bg_color, (x, y, width, self.button_height), border_radius=8
-        )
-        pygame.draw.rect(
-            surface,
-            border_color,
-            (x, y, width, self.button_height),
-            width=2,
-            border_radius=8,
-        )
-
-        button_text = self.fonts["ui"].render(text, True, self.button_text_color)
-        text_rect = button_text.get_rect(
-            center=(x + width // 2, y + self.button_height // 2)
-        )
-        surface.blit(button_text, text_rect)
-
-    def _is_player_x_input_clicked(self, mouse_x: int, mouse_y: int) -> bool:
-        y = self.content_start_y
-        return (
-            self.input_x <= mouse_x <= self.input_x + self.input_width
-            and y <= mouse_y <= y + self.input_height
-        )
-
-    def _is_player_o_input_clicked(self, mouse_x: int, mouse_y: int) -> bool:
-        y = self.content_start_y + self.input_spacing
-        return (
-            self.input_x <= mouse_x <= self.input_x + self.input_width
-            and y <= mouse_y <= y + self.input_height
-        )
+    ) -> pygame.Surface:
+        """Render a rounded button with its caption centered."""
+        button = pygame.Surface(size, pygame.SRCALPHA)
+        rect = button.get_rect()
+        pygame.draw.rect(button, bg_color, rect, border_radius=8)
+        pygame.draw.rect(button, border_color, rect, width=2, border_radius=8)
 
-    def _is_difficulty_area_clicked(self, mouse_x: int, mouse_y: int) -> bool:
-        y = self.content_start_y + 2 * self.input_spacing
-        return (
-            self.input_x <= mouse_x <= self.input_x + self.input_width
-            and y <= mouse_y <= y + self.input_height
-        )
-
-    def _is_play_pvp_button_clicked(self, mouse_x: int, mouse_y: int) -> bool:
-        y = self.content_start_y + 200
-        return (
-            self.button_x <= mouse_x <= self.button_x + self.button_width
-            and y <= mouse_y <= y + self.button_height
-        )
-
-    def _is_play_vs_ai_button_clicked(self, mouse_x: int, mouse_y: int) -> bool:
-        y = self.content_start_y + 200 + self.button_height + self.button_spacing
-        return (
-            self.button_x <= mouse_x <= self.button_x + self.button_width
-            and y <= mouse_y <= y + self.button_height
-        )
-
-    def _is_leaderboard_button_clicked(self, mouse_x: int, mouse_y: int) -> bool:
-        y = self.content_start_y + 200 + 2 * (self.button_height + self.button_spacing)
-        secondary_x = (self.width - 150) // 2
-        return (
-            secondary_x <= mouse_x <= secondary_x + 150
-            and y <= mouse_y <= y + self.button_height
-        )
+        button_text = self._static_text[caption]
+        button.blit(button_text, button_text.get_rect(center=rect.center))
+        return self._to_display_format(button)
 
-    def _is_history_button_clicked(self, mouse_x: int, mouse_y: int) -> bool:
-        y = self.content_start_y + 200 + 3 * (self.button_height + self.button_spacing)
-        secondary_x = (self.width - 150) // 2
-        return (
-            secondary_x <= mouse_x <= secondary_x + 150
-            and y <= mouse_y <= y + self.button_height
-        )
-
-    def _is_reset_button_clicked(self, mouse_x: int, mouse_y: int) -> bool:
-        y = self.content_start_y + 200 + 4 * (self.button_height + self.button_spacing)
-        secondary_x = (self.width - 150) // 2
-        return (
-            secondary_x <= mouse_x <= secondary_x + 150
-            and y <= mouse_y <= y + self.button_height
-        )
-
-    def _is_quit_button_clicked(self, mouse_x: int, mouse_y: int) -> bool:
-        y = self.content_start_y + 200 + 5 * (self.button_height + self.button_spacing)
-        secondary_x = (self.width - 150) // 2
-        return (
-            secondary_x <= mouse_x <= secondary_x + 150
-            and y <= mouse_y <= y + self.button_height
-        )
+    def _draw_buttons(self, surface: pygame.Surface) -> None:
+        """Draw action buttons."""
+        surface.blits(self._button_blit_list, doreturn=False)
@@ -4,8 +4,9 @@ Reset confirmation scene for confirming data reset using pygame.
 
 import pygame
 
-from ..app.scene import Scene
+from ..app.scene import MENU_BLOCKED_EVENTS, Scene
 from ..consts.scene_consts import SceneTransition
+from ..consts.theme_consts import FontSlot
 from ..infra.logger import get_logger
 from ..infra.storage import Storage
 from ..ui.layout import compute_layout, make_fonts
@@ -16,6 +17,38 @@ logger = get_logger()
 class ResetScene(Scene):
     """Pygame scene for confirming data reset."""
 
+    # No hover highlights here, so mouse motion can be dropped too.
+    blocked_events = (*MENU_BLOCKED_EVENTS, pygame.MOUSEMOTION)
+
+    __slots__ = (
+        "storage",
+        "fonts",
+        "bg_color",
+        "title_color",
+        "text_color",
+        "header_color",
+        "accent_color",
+        "warning_color",
+        "error_color",
+        "title_y",
+        "content_start_y",
+        "button_width",
+        "button_height",
+        "button_spacing",
+        "yes_button_rect",
+        "no_button_rect",
+        "back_button_rect",
+        "_button_rects",
+        "_static_text",
+        "_static_layer",
+    )
+
+    _BUTTON_ACTIONS = (
+        (SceneTransition.MENU, "Back button clicked - returning to menu"),
+        (SceneTransition.RESET_CONFIRMED, "Yes button clicked - executing reset"),
+        (SceneTransition.MENU, "No button clicked - returning to menu"),
+    )
+
     def __init__(self, storage: Storage, width: int = 1000, height: int = 1100) -> None:
         """
         Initialize reset scene.
@@ -52,6 +85,63 @@ class ResetScene(Scene):
         self.button_height = 60
         self.button_spacing = 30
 
+        total_button_width = 2 * self.button_width + self.button_spacing
+        start_x = (self.width - total_button_width) // 2
+        button_y = self.content_start_y + 150
+
+        self.yes_button_rect = pygame.Rect(
+            start_x, button_y, self.button_width, self.button_height
+        )
+        self.no_button_rect = pygame.Rect(
+            start_x + self.button_width + self.button_spacing,
+            button_y,
+            self.button_width,
+            self.button_height,
+        )
+        self.back_button_rect = pygame.Rect(20, height - 70, 100, 50)
+        self._button_rects = [
+            self.back_button_rect,
+            self.yes_button_rect,
+            self.no_button_rect,
+        ]
+
+        self._static_text = self._render_static_text()
+        self._static_layer = self._build_static_layer()
+
+    def _render_static_text(self) -> dict[str, pygame.Surface]:
+        """
+        Pre-render every text surface that does not change between frames.
+
+        Returns:
+            Dictionary mapping text keys to rendered surfaces
+        """
+        static_text = {
+            "title": self.fonts[FontSlot.TITLE].render(
+                "CONFIRM RESET", True, self.title_color
+            ),
+            "question": self.fonts[FontSlot.UI].render(
+                "Are you sure you want to reset all data?", True, self.text_color
+            ),
+            "warning": self.fonts[FontSlot.SMALL].render(
+                "This will delete all match history and leaderboard data.",
+                True,
+                self.warning_color,
+            ),
+            "warning2": self.fonts[FontSlot.SMALL].render(
+                "This action cannot be undone!", True, self.error_color
+            ),
+            "instructions": self.fonts[FontSlot.SMALL].render(
+                "Press ESC or click Back to return to menu", True, self.header_color
+            ),
+        }
+
+        for caption in ("YES, RESET", "NO, CANCEL", "Back"):
+            static_text[caption] = self.fonts[FontSlot.UI].render(
+                caption, True, self.text_color
+            )
+
+        return {key: self._to_display_format(text) for key, text in static_text.items()}
+
     def handle_event(self, event: pygame.event.Event) -> str | None:
         """
         Handle pygame events.
@@ -69,42 +159,51 @@ class ResetScene(Scene):
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:
                 mouse_x, mouse_y = event.pos
-                if self._is_back_button_clicked(mouse_x, mouse_y):
-                    logger.info("Back button clicked - returning to menu")
-                    return SceneTransition.MENU
-                elif self._is_yes_button_clicked(mouse_x, mouse_y):
-                    logger.info("Yes button clicked - executing reset")
-                    return SceneTransition.RESET_CONFIRMED
-                elif self._is_no_button_clicked(mouse_x, mouse_y):
-                    logger.info("No button clicked - returning to menu")
-                    return SceneTransition.MENU
+                hit = pygame.Rect(mouse_x, mouse_y, 1, 1).collidelist(
+                    self._button_rects
+                )
+                if hit != -1:
+                    transition, message = self._BUTTON_ACTIONS[hit]
+                    logger.info(message)
+                    return transition
         return None
 
-    def draw(self, surface: pygame.Surface) -> None:
+    def _build_static_layer(self) -> pygame.Surface:
         """
-        Draw the reset confirmation scene.
+        Pre-compose the whole scene, which has no per-frame state.
 
-        Args:
-            surface: Pygame surface to draw on
+        Returns:
+            Display-format surface with the complete confirmation screen
         """
-        surface.fill(self.bg_color)
+        layer = self._to_display_format(
+            pygame.Surface((self.width, self.height)), alpha=False
+        )
+        layer.fill(self.bg_color)
 
-        title_text = self.fonts["title"].render("CONFIRM RESET", True, self.title_color)
+        title_text = self._static_text["title"]
         title_rect = title_text.get_rect(center=(self.width // 2, self.title_y))
-        surface.blit(title_text, title_rect)
+        layer.blit(title_text, title_rect)
 
-        self._draw_confirmation_message(surface)
+        self._draw_confirmation_message(layer)
 
-        self._draw_buttons(surface)
+        self._draw_buttons(layer)
 
-        self._draw_back_button(surface)
+        self._draw_back_button(layer)
 
-        instructions = self.fonts["small"].render(
-            "Press ESC or click Back to return to menu", True, self.header_color
-        )
-        surface.blit(
+        instructions = self._static_text["instructions"]
+        layer.blit(
             instructions, (self.width - instructions.get_width() - 20, self.height - 30)
         )
+        return layer
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """
+        Draw the reset confirmation scene.
+
+        Args:
+            surface: Pygame surface to draw on
+        """
+        surface.blit(self._static_layer, (0, 0))
 
     def _draw_confirmation_message(self, surface: pygame.Surface) -> None:
         """
@@ -113,27 +212,19 @@ class ResetScene(Scene):
         Args:
             surface: Pygame surface to draw on
         """
-        question_text = self.fonts["ui"].render(
-            "Are you sure you want to reset all data?", True, self.text_color
-        )
+        question_text = self._static_text["question"]
         question_rect = question_text.get_rect(
             center=(self.width // 2, self.content_start_y)
         )
         surface.blit(question_text, question_rect)
 
-        warning_text = self.fonts["small"].render(
-            "This will delete all match history and leaderboard data.",
-            True,
-            self.warning_color,
-        )
+        warning_text = self._static_text["warning"]
         warning_rect = warning_text.get_rect(
             center=(self.width // 2, self.content_start_y + 50)
         )
         surface.blit(warning_text, warning_rect)
 
-        warning2_text = self.fonts["small"].render(
-            "This action cannot be undone!", True, self.error_color
-        )
+        warning2_text = self._static_text["warning2"]
         warning2_rect = warning2_text.get_rect(
             center=(self.width // 2, self.content_start_y + 80)
         )
@@ -146,30 +237,18 @@ class ResetScene(Scene):
         Args:
             surface: Pygame surface to draw on
         """
-        total_button_width = 2 * self.button_width + self.button_spacing
-        start_x = (self.width - total_button_width) // 2
-        button_y = self.content_start_y + 150
-
-        yes_x = start_x
         self._draw_button(
             surface,
             "YES, RESET",
-            yes_x,
-            button_y,
-            self.button_width,
-            self.button_height,
+            *self.yes_button_rect,
             self.error_color,
             (255, 150, 150),
         )
 
-        no_x = start_x + self.button_width + self.button_spacing
         self._draw_button(
             surface,
             "NO, CANCEL",
-            no_x,
-            button_y,
-            self.button_width,
-            self.button_height,
+            *self.no_button_rect,
             (100, 100, 100),
             (150, 150, 150),
         )
@@ -203,7 +282,7 @@ class ResetScene(Scene):
             surface, border_color, (x, y, width, height), width=2, border_radius=8
         )
 
-        button_text = self.fonts["ui"].render(text, True, self.text_color)
+        button_text = self._static_text[text]
         text_rect = button_text.get_rect(center=(x + width // 2, y + height // 2))
         surface.blit(button_text, text_rect)
 
@@ -214,91 +293,20 @@ class ResetScene(Scene):
         Args:
             surface: Pygame surface to draw on
         """
-        button_width = 100
-        button_height = 50
-        button_x = 20
-        button_y = self.height - 70
-
         pygame.draw.rect(
             surface,
             (80, 80, 80),
-            (button_x, button_y, button_width, button_height),
+            self.back_button_rect,
             border_radius=8,
         )
         pygame.draw.rect(
             surface,
             (120, 120, 120),
-            (button_x, button_y, button_width, button_height),
+            self.back_button_rect,
             width=2,
             border_radius=8,
         )
 
-        back_text = self.fonts["ui"].render("Back", True, self.text_color)
-        text_rect = back_text.get_rect(
-            center=(button_x + button_width // 2, button_y + button_height // 2)
-        )
+        back_text = self._static_text["Back"]
+        text_rect = back_text.get_rect(center=self.back_button_rect.center)
         surface.blit(back_text, text_rect)
-
-        self.back_button_rect = pygame.Rect(
-            button_x, button_y, button_width, button_height
-        )
-
-    def _is_back_button_clicked(self, mouse_x: int, mouse_y: int) -> bool:
-        """
-        Check if the back button was clicked.
-
-        Args:
-            mouse_x: Mouse X position
-            mouse_y: Mouse Y position
-
-        Returns:
-            True if back button was clicked
-        """
-        return hasattr(self, "back_button_rect") and self.back_button_rect.collidepoint(
-            mouse_x, mouse_y
-        )
-
-    def _is_yes_button_clicked(self, mouse_x: int, mouse_y: int) -> bool:
-        """
-        Check if the Yes button was clicked.
-
-        Args:
-            mouse_x: Mouse X position
-            mouse_y: Mouse Y position
-
-        Returns:
-            True if Yes button was clicked
-        """
-        if not hasattr(self, "yes_button_rect"):
-            total_button_width = 2 * self.button_width + self.button_spacing
-            start_x = (self.width - total_button_width) // 2
-            button_y = self.content_start_y + 150
-            self.yes_button_rect = pygame.Rect(
-                start_x, button_y, self.button_width, self.button_height
-            )
-
-        return self.yes_button_rect.collidepoint(mouse_x, mouse_y)
-
-    def _is_no_button_clicked(self, mouse_x: int, mouse_y: int) -> bool:
-        """
-        Check if the No button was clicked.
-
-        Args:
-            mouse_x: Mouse X position
-            mouse_y: Mouse Y position
-
-        Returns:
-            True if No button was clicked
-        """
-        if not hasattr(self, "no_button_rect"):
-            total_button_width = 2 * self.button_width + self.button_spacing
-            start_x = (self.width - total_button_width) // 2
-            button_y = self.content_start_y + 150
-            self.no_button_rect = pygame.Rect(
-                start_x + self.button_width + self.button_spacing,
-                button_y,
-                self.button_width,
-                self.button_height,
-            )
-
-        return self.no_button_rect.collidepoint(mouse_x, mouse_y)
@@ -5,34 +5,42 @@ This module handles saving and loading window dimensions to provide
 a consistent user experience across application sessions.
 """
 
+import atexit
 import json
+import os
 from contextlib import suppress
+from functools import lru_cache
 from pathlib import Path
-from typing import TextIO
 
 import pygame
 
 from ..ui.layout import clamp
 
+_pending_size: tuple[int, int] | None = None
+_last_saved_size: tuple[int, int] | None = None
 
+
+@lru_cache(maxsize=1)
 def get_initial_window_size() -> tuple[int, int]:
     """
     Get initial window size based on saved preferences or desktop percentage.
 
+    Only the display subsystem is initialized to probe the desktop size;
+    callers that need the rest of pygame still call pygame.init() themselves.
+
     Returns:
         Tuple of (width, height) for initial window
     """
     with suppress(Exception):
         window_file = Path(__file__).parent / "window.json"
         if window_file.exists():
-            with open(window_file) as f:
-                data = json.load(f)
-                width = int(clamp(data["w"], 900, 1600))
-                height = int(clamp(data["h"], 900, 1600))
-                return width, height
+            data = json.loads(window_file.read_text())
+            width = int(clamp(data["w"], 900, 1600))
+            height = int(clamp(data["h"], 900, 1600))
+            return width, height
 
     with suppress(Exception):
-        pygame.init()
+        pygame.display.init()
         desktop_info = pygame.display.Info()
         width = int(clamp(desktop_info.current_w * 0.8, 900, 1600))
         height = int(clamp(desktop_info.current_h * 0.8, 900, 1600))
@@ -44,14 +52,32 @@ def get_initial_window_size() -> tuple[int, int]:
 
 def save_window_size(width: int, height: int) -> None:
     """
-    Save current window size for next launch.
+    Remember current window size for next launch.
+
+    The size is only held in memory here; it is written to disk once, when
+    the interpreter exits, so resize drags do not hit the filesystem.
 
     Args:
         width: Window width
         height: Window height
     """
+    global _pending_size
+    if _pending_size is None:
+        atexit.register(flush_window_size)
+    _pending_size = (width, height)
+
+
+def flush_window_size() -> None:
+    """Atomically write the remembered window size if it changed."""
+    global _last_saved_size
+    if _pending_size is None or _pending_size == _last_saved_size:
+        return
+
+    width, height = _pending_size
     with suppress(Exception):
         window_file = Path(__file__).parent / "window.json"
-        with open(window_file, "w") as f:
-            f: TextIO
-            json.dump({"w": width, "h": height}, f)
+        tmp_file = window_file.with_suffix(".json.tmp")
+        tmp_file.write_bytes(json.dumps({"w": width, "h": height}).encode())
+        os.replace(tmp_file, window_file)
+        _last_saved_size = _pending_size
+    get_initial_window_size.cache_clear()
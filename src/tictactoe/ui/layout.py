@@ -6,6 +6,7 @@ ensuring consistent layout across all scenes regardless of window size.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 import pygame
 
@@ -15,7 +16,16 @@ def clamp(value: float, min_val: float, max_val: float) -> float:
     return max(min_val, min(max_val, value))
 
 
-@dataclass
+def _clamp_int(value: float, min_val: int, max_val: int) -> int:
+    """Clamp a value between integer bounds and truncate it to an int."""
+    if value < min_val:
+        return min_val
+    if value > max_val:
+        return max_val
+    return int(value)
+
+
+@dataclass(frozen=True)
 class Layout:
     """Layout configuration for a given window size."""
 
@@ -40,10 +50,14 @@ class Layout:
     menu_height: int
 
 
+@lru_cache(maxsize=32)
 def compute_layout(width: int, height: int) -> Layout:
     """
     Compute responsive layout for given window dimensions.
 
+    Results are memoized per size; every scene asks for the same layout on
+    each resize, and Layout is frozen so the shared instance is safe.
+
     Args:
         width: Window width in pixels
         height: Window height in pixels
@@ -51,25 +65,23 @@ def compute_layout(width: int, height: int) -> Layout:
     Returns:
         Layout object with all calculated dimensions
     """
-    safe_margin = int(min(width, height) * 0.04)
+    base_size = min(width, height)
+    safe_margin = int(base_size * 0.04)
 
-    header_height = int(clamp(height * 0.12, 80, 180))
+    header_height = _clamp_int(height * 0.12, 80, 180)
 
     available_width = width - 2 * safe_margin
     available_height = height - header_height - 2 * safe_margin
-    grid_size = min(available_width, available_height)
-
-    grid_size -= grid_size % 3
-    cell_size = grid_size // 3
+    cell_size = min(available_width, available_height) // 3
+    grid_size = cell_size * 3
 
     grid_x = (width - grid_size) // 2
     grid_y = header_height + ((height - header_height - grid_size) // 2)
 
-    base_size = min(width, height)
-    font_title = int(clamp(base_size * 0.050, 28, 64))
-    font_ui = int(clamp(base_size * 0.028, 18, 36))
-    font_mark = int(clamp(cell_size * 0.60, 28, 120))
-    font_small = int(clamp(base_size * 0.020, 14, 24))
+    font_title = _clamp_int(base_size * 0.050, 28, 64)
+    font_ui = _clamp_int(base_size * 0.028, 18, 36)
+    font_mark = _clamp_int(cell_size * 0.60, 28, 120)
+    font_small = _clamp_int(base_size * 0.020, 14, 24)
 
     menu_width = int(width * 0.9)
     menu_height = int(height * 0.9)
@@ -92,57 +104,36 @@ def compute_layout(width: int, height: int) -> Layout:
     )
 
 
-def make_fonts(layout: Layout) -> dict[str, pygame.font.Font]:
-    """
-    Create font objects based on layout configuration.
-
-    Args:
-        layout: Layout object with font sizes
-
-    Returns:
-        Dictionary of font objects
-    """
-    return {
-        "title": pygame.font.Font(None, layout.font_title),
-        "ui": pygame.font.Font(None, layout.font_ui),
-        "mark": pygame.font.Font(None, layout.font_mark),
-        "small": pygame.font.Font(None, layout.font_small),
-    }
-
-
-def get_cell_from_mouse(mouse_x: int, mouse_y: int, layout: Layout) -> tuple[int, int]:
+@lru_cache(maxsize=32)
+def _font(size: int) -> pygame.font.Font:
     """
-    Convert mouse coordinates to grid cell coordinates.
+    Load the default font at a given size, sharing it across layouts.
 
     Args:
-        mouse_x: Mouse X position
-        mouse_y: Mouse Y position
-        layout: Layout object with grid positioning
+        size: Font size in pixels
 
     Returns:
-        Tuple of (col, row) or (-1, -1) if outside grid
+        Font object
     """
-    col = (mouse_x - layout.grid_x) // layout.cell_size
-    row = (mouse_y - layout.grid_y) // layout.cell_size
-
-    if 0 <= col < 3 and 0 <= row < 3:
-        return col, row
-    else:
-        return -1, -1
+    return pygame.font.Font(None, size)
 
 
-def get_cell_rect(col: int, row: int, layout: Layout) -> pygame.Rect:
+def make_fonts(layout: Layout) -> tuple[pygame.font.Font, ...]:
     """
-    Get the rectangle for a specific grid cell.
+    Create font objects based on layout configuration.
 
     Args:
-        col: Column (0-2)
-        row: Row (0-2)
-        layout: Layout object with grid positioning
+        layout: Layout object with font sizes
 
     Returns:
-        pygame.Rect for the cell
+        Tuple of font objects indexed by FontSlot
     """
-    x = layout.grid_x + col * layout.cell_size
-    y = layout.grid_y + row * layout.cell_size
-    return pygame.Rect(x, y, layout.cell_size, layout.cell_size)
+    if not pygame.font.get_init():
+        pygame.font.init()
+        _font.cache_clear()
+    return (
+        _font(layout.font_title),
+        _font(layout.font_ui),
+        _font(layout.font_mark),
+        _font(layout.font_small),
+    )
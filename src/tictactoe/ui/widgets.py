@@ -6,13 +6,37 @@ from collections.abc import Callable
 
 import pygame
 
-from ..consts.board_consts import Player
-from ..consts.theme_consts import Colors
+from ..consts.board_consts import WIN_LINES, Player
+from ..consts.theme_consts import Colors, FontSlot
 from ..domain.board import Board
 from ..infra.logger import get_logger
 
 logger = get_logger()
 
+_X = Player.X_PLAYER.value
+_O = Player.O_PLAYER.value
+_EMPTY = Player.EMPTY.value
+
+
+def _blit_batch(
+    surface: pygame.Surface, blit_sequence: list[tuple[pygame.Surface, tuple]]
+) -> None:
+    """
+    Blit a batch of (source, position) pairs in a single call.
+
+    Uses Surface.fblits where the installed pygame provides it (pygame-ce),
+    otherwise falls back to Surface.blits without collecting the result rects.
+
+    Args:
+        surface: Pygame surface to draw on
+        blit_sequence: (source surface, destination) pairs
+    """
+    fblits = getattr(surface, "fblits", None)
+    if fblits is not None:
+        fblits(blit_sequence)
+    else:
+        surface.blits(blit_sequence, doreturn=False)
+
 
 class GameUI:
     """Game UI widget for pygame-based tic-tac-toe board."""
@@ -24,7 +48,7 @@ class GameUI:
         Args:
             board: Board instance
             layout: Layout instance for responsive sizing
-            fonts: Font dictionary
+            fonts: Font tuple indexed by FontSlot
         """
         self.board = board
         self.layout = layout
@@ -33,10 +57,11 @@ class GameUI:
         self.board_size = 3
         self.board_width = min(self.layout.width, self.layout.height) * 0.6
         self.board_height = self.board_width
-        self.cell_size = self.board_width // self.board_size
+        self.cell_size = int(self.board_width // self.board_size)
 
-        self.board_x = (self.layout.width - self.board_width) // 2
-        self.board_y = (self.layout.height - self.board_height) // 2
+        self.board_x = int((self.layout.width - self.board_width) // 2)
+        self.board_y = int((self.layout.height - self.board_height) // 2)
+        self._recalc_geometry()
 
         self.back_button_width = 100
         self.back_button_height = 50
@@ -44,27 +69,59 @@ class GameUI:
         self.back_button_y = 50
 
         self.screen = None
-        self.running = True
-        self.current_player = Player.X_PLAYER.value
+        self.current_player = _X
         self.game_over = False
         self.winner = None
         self.hovered_cell = None
 
         self.player_x_name = "Player X"
         self.player_o_name = "Player O"
+        self._player_names = {_X: self.player_x_name, _O: self.player_o_name}
 
         self.width = layout.width
         self.height = layout.height
 
-        self.font = fonts.get("ui", pygame.font.Font(None, 24))
-        self.status_font = fonts.get("small", pygame.font.Font(None, 18))
-
-        self.clock = pygame.time.Clock()
+        self.font = fonts[FontSlot.UI]
+        self.status_font = fonts[FontSlot.SMALL]
+
+        self._build_piece_surfaces()
+
+        self._text_cache: dict[tuple, pygame.Surface] = {}
+        self._banner_surfs: dict[str, pygame.Surface] = {}
+        self._frame: pygame.Surface | None = None
+        self._bg_surf: pygame.Surface | None = None
+        self._back_button_surf: pygame.Surface | None = None
+        self._bg_key = None
+        self._frame_key = None
+        self._drawn_state = None
+        self._dirty = True
+        self._banner_rect: pygame.Rect | None = None
+        self._drawn_board_key: tuple[int, ...] = ()
+        self._drawn_hover: tuple[int, int] | None = None
+        self._drawn_player: int | None = None
 
         logger.info("GameUI initialized")
         self.on_move_callback: Callable[[tuple[int, int], int], None] | None = None
         self.on_game_over_callback: Callable[[int | None], None] | None = None
 
+    def _recalc_geometry(self) -> None:
+        """Cache per-cell pixel positions for the current board origin and cell size."""
+        size = self.cell_size
+        half = size // 2
+        extent = self.board_size * size
+
+        self._cell_xs = tuple(
+            self.board_x + col * size for col in range(self.board_size)
+        )
+        self._cell_ys = tuple(
+            self.board_y + row * size for row in range(self.board_size)
+        )
+        self._cell_cxs = tuple(x + half for x in self._cell_xs)
+        self._cell_cys = tuple(y + half for y in self._cell_ys)
+        self._grid_rect = pygame.Rect(self.board_x, self.board_y, extent, extent)
+        self._board_x_end = self.board_x + extent
+        self._board_y_end = self.board_y + extent
+
     def set_move_callback(
         self, callback: Callable[[tuple[int, int], int], None]
     ) -> None:
@@ -98,14 +155,10 @@ class GameUI:
         if self.game_over:
             return False
 
-        x, y = pos
-        col = int((x - self.board_x) // self.cell_size)
-        row = int((y - self.board_y) // self.cell_size)
-
-        if 0 <= row < self.board_size and 0 <= col < self.board_size:
-            if self.board.is_valid_move((row, col)):
-                self._make_move((row, col))
-                return True
+        cell = self._get_cell_from_pos(pos)
+        if cell is not None and self.board.is_valid_move(cell):
+            self._make_move(cell)
+            return True
         return False
 
     def handle_mouse_motion(self, pos: tuple[int, int]) -> None:
@@ -120,6 +173,8 @@ class GameUI:
             return
 
         cell = self._get_cell_from_pos(pos)
+        if cell == self.hovered_cell:
+            return
         self.hovered_cell = cell
 
     def _get_cell_from_pos(self, pos: tuple[int, int]) -> tuple[int, int] | None:
@@ -133,11 +188,11 @@ class GameUI:
             (row, col) if position is valid, None otherwise
         """
         x, y = pos
-        col = int((x - self.board_x) // self.cell_size)
-        row = int((y - self.board_y) // self.cell_size)
-
-        if 0 <= row < self.board_size and 0 <= col < self.board_size:
-            return row, col
+        board_x = self.board_x
+        board_y = self.board_y
+        if board_x <= x < self._board_x_end and board_y <= y < self._board_y_end:
+            cell_size = self.cell_size
+            return (y - board_y) // cell_size, (x - board_x) // cell_size
         return None
 
     def get_cell_from_mouse(self, mouse_x: int, mouse_y: int) -> tuple[int, int] | None:
@@ -174,16 +229,12 @@ class GameUI:
                 if self.on_game_over_callback:
                     self.on_game_over_callback(self.winner)
             else:
-                self.current_player = (
-                    Player.O_PLAYER.value
-                    if self.current_player == Player.X_PLAYER.value
-                    else Player.X_PLAYER.value
-                )
+                self.current_player = _O if self.current_player == _X else _X
 
     def _reset_game(self) -> None:
         """Reset the game to initial state."""
         self.board.reset()
-        self.current_player = Player.X_PLAYER.value
+        self.current_player = _X
         self.game_over = False
         self.winner = None
         self.hovered_cell = None
@@ -213,43 +264,178 @@ class GameUI:
         self.current_player = current_player
         self.game_over = game_over
         self.winner = winner
+        if (player_x_name, player_o_name) != (self.player_x_name, self.player_o_name):
+            # Banners are cached per caption; drop the previous players' ones.
+            self._banner_surfs.clear()
         self.player_x_name = player_x_name
         self.player_o_name = player_o_name
+        self._player_names = {_X: player_x_name, _O: player_o_name}
 
     def update(self) -> None:
         """Update game state."""
         pass
 
-    def render(self, surface: pygame.Surface) -> None:
+    def render(self, surface: pygame.Surface) -> bool:
         """
         Render the game to a surface.
 
         Args:
             surface: Pygame surface to render to
-        """
-        logger.debug(f"GameUI.render START - surface size: {surface.get_size()}")
-        logger.debug(
-            f"GameUI.render - game_over: {self.game_over}, current_player: {self.current_player}"
+
+        Returns:
+            True if the surface was redrawn, False if it already showed this state
+        """
+        size = surface.get_size()
+        frame_key = (
+            size,
+            self.game_over,
+            self.winner,
+            self.player_x_name,
+            self.player_o_name,
         )
+        state_key = (
+            frame_key,
+            self.board.cells(),
+            self.hovered_cell,
+            self.current_player,
+        )
+        if (
+            not self._dirty
+            and surface is self.screen
+            and state_key == self._drawn_state
+        ):
+            return False
 
         self.screen = surface
+        if self._frame is None or frame_key != self._frame_key:
+            self._compose_frame(size)
+            self._frame_key = frame_key
+        else:
+            self._update_dirty_regions()
+
+        surface.blit(self._frame, (0, 0))
+        self._drawn_state = state_key
+        self._dirty = False
+        return True
+
+    def invalidate(self) -> None:
+        """Force the next render to redraw the target surface."""
+        self._dirty = True
+
+    def _compose_frame(self, size: tuple[int, int]) -> None:
+        """
+        Draw the whole game view into the cached off-screen frame.
 
-        surface.fill(Colors.BACKGROUND)
-        logger.debug("GameUI.render - surface filled with background")
+        Args:
+            size: Size of the target surface
+        """
+        bg_key = (size, self.board_x, self.board_y, self.cell_size)
+        if self._bg_surf is None or bg_key != self._bg_key:
+            self._build_background(size)
+            self._bg_key = bg_key
+
+        frame = self._frame
+        if frame is None or frame.get_size() != size:
+            frame = pygame.Surface(size)
+            if pygame.display.get_surface() is not None:
+                frame = frame.convert()
+            self._frame = frame
 
-        logger.debug("GameUI.render - calling _draw_back_button")
-        self._draw_back_button(surface)
+        frame.blit(self._bg_surf, (0, 0))
 
-        logger.debug("GameUI.render - calling _draw_player_turn_top")
-        self._draw_player_turn_top(surface)
+        self._draw_back_button(frame)
 
-        logger.debug("GameUI.render - calling _draw_board")
-        self._draw_board(surface)
+        self._draw_player_turn_top(frame)
 
-        logger.debug("GameUI.render - calling _draw_game_status")
-        self._draw_game_status(surface)
+        self._draw_board_contents(frame)
 
-        logger.debug("GameUI.render END")
+        self._draw_game_status(frame)
+
+        self._drawn_board_key = self.board.cells()
+        self._drawn_hover = self.hovered_cell
+        self._drawn_player = self.current_player
+
+    def _update_dirty_regions(self) -> None:
+        """Redraw only the cells and turn banner that changed since last frame."""
+        if self.game_over:
+            # The finished board, win line and status are frozen until the
+            # next game, which recomposes the whole frame.
+            return
+
+        frame = self._frame
+        hovered_cell = self.hovered_cell
+        drawn_board_key = self._drawn_board_key
+        board_size = self.board_size
+
+        board_key = self.board.cells()
+        dirty = set()
+        if board_key != drawn_board_key:
+            dirty.update(
+                divmod(index, board_size)
+                for index, (old, new) in enumerate(
+                    zip(drawn_board_key, board_key, strict=True)
+                )
+                if old != new
+            )
+        if hovered_cell != self._drawn_hover:
+            dirty.update(cell for cell in (self._drawn_hover, hovered_cell) if cell)
+
+        if len(dirty) > 4:
+            self._draw_board(frame)
+        else:
+            draw_cell = self._draw_cell
+            for row, col in dirty:
+                draw_cell(frame, row, col)
+
+        current_player = self.current_player
+        if current_player != self._drawn_player:
+            banner_rect = self._banner_rect
+            if banner_rect is not None:
+                frame.blit(self._bg_surf, banner_rect, banner_rect)
+            self._draw_back_button(frame)
+            self._draw_player_turn_top(frame)
+
+        self._drawn_board_key = board_key
+        self._drawn_hover = hovered_cell
+        self._drawn_player = current_player
+
+    def _draw_cell(self, surface: pygame.Surface, row: int, col: int) -> None:
+        """
+        Draw a single cell with its piece and hover outline.
+
+        Args:
+            surface: Pygame surface to draw on
+            row: Row position
+            col: Column position
+        """
+        cell_pos = (self._cell_xs[col], self._cell_ys[row])
+        surface.blit(self._cell_tiles[self.board.get_cell(row, col)], cell_pos)
+
+        if self.hovered_cell == (row, col) and not self.game_over:
+            surface.blit(self._hover_surf, cell_pos)
+
+    def _render_text(
+        self, font: pygame.font.Font, text: str, color: tuple
+    ) -> pygame.Surface:
+        """
+        Render text, reusing the surface from an earlier identical request.
+
+        Args:
+            font: Font to render with
+            text: Text to render
+            color: Text color
+
+        Returns:
+            Rendered text surface
+        """
+        key = (text, font, color)
+        text_surface = self._text_cache.get(key)
+        if text_surface is None:
+            text_surface = font.render(text, True, color)
+            if pygame.display.get_surface() is not None:
+                text_surface = text_surface.convert_alpha()
+            self._text_cache[key] = text_surface
+        return text_surface
 
     def _draw_player_turn_top(self, surface: pygame.Surface) -> None:
         """
@@ -258,42 +444,74 @@ class GameUI:
         Args:
             surface: Pygame surface to draw on
         """
-        logger.debug(f"_draw_player_turn_top START - game_over: {self.game_over}")
-
         if self.game_over:
-            logger.debug("_draw_player_turn_top - game is over, skipping turn display")
+            self._banner_rect = None
             return
 
-        current_player_name = self._get_current_player_name()
-        turn_text = f"{current_player_name}'s Turn"
+        turn_text = f"{self._get_current_player_name()}'s Turn"
+        banner_surf = self._banner_surfs.get(turn_text)
+        if banner_surf is None:
+            banner_surf = self._build_turn_banner(turn_text)
+            self._banner_surfs[turn_text] = banner_surf
 
-        logger.debug(
-            f"_draw_player_turn_top - turn_text: '{turn_text}', current_player: {self.current_player}"
-        )
+        banner_rect = banner_surf.get_rect(center=(surface.get_width() // 2, 60))
+        surface.blit(banner_surf, banner_rect)
+        self._banner_rect = banner_rect
 
-        turn_surface = self.fonts["title"].render(turn_text, True, Colors.TEXT)
-        turn_rect = turn_surface.get_rect(center=(surface.get_width() // 2, 60))
+    def _build_turn_banner(self, turn_text: str) -> pygame.Surface:
+        """
+        Composite the turn text and its rounded border into one surface.
+
+        Args:
+            turn_text: Text to show inside the banner
 
+        Returns:
+            Surface holding the finished banner
+        """
+        turn_surface = self._render_text(
+            self.fonts[FontSlot.TITLE], turn_text, Colors.TEXT
+        )
         padding = 8
-        border_rect = pygame.Rect(
-            turn_rect.left - padding,
-            turn_rect.top - padding,
-            turn_rect.width + 2 * padding,
-            turn_rect.height + 2 * padding,
+        banner_surf = pygame.Surface(
+            (
+                turn_surface.get_width() + 2 * padding,
+                turn_surface.get_height() + 2 * padding,
+            ),
+            pygame.SRCALPHA,
         )
-
         pygame.draw.rect(
-            surface, Colors.BOARD_LINE, border_rect, width=2, border_radius=8
+            banner_surf,
+            Colors.BOARD_LINE,
+            banner_surf.get_rect(),
+            width=2,
+            border_radius=8,
         )
+        banner_surf.blit(turn_surface, (padding, padding))
 
-        logger.debug(
-            f"_draw_player_turn_top - text position: {turn_rect.center}, text size: {turn_surface.get_size()}"
-        )
+        if pygame.display.get_surface() is not None:
+            banner_surf = banner_surf.convert_alpha()
+        return banner_surf
 
-        surface.blit(turn_surface, turn_rect)
-        logger.debug("_draw_player_turn_top - text blitted to surface")
+    def _build_background(self, size: tuple[int, int]) -> None:
+        """
+        Pre-render the static background and empty grid for the current size.
 
-        logger.debug("_draw_player_turn_top END")
+        Args:
+            size: Size of the target surface
+        """
+        bg_surf = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            bg_surf = bg_surf.convert()
+
+        bg_surf.fill(Colors.BACKGROUND)
+        empty_tile = self._cell_tiles[_EMPTY]
+        _blit_batch(
+            bg_surf,
+            [(empty_tile, (x, y)) for y in self._cell_ys for x in self._cell_xs],
+        )
+
+        self._bg_surf = bg_surf
+        logger.debug(f"GameUI background built for size {size}")
 
     def _draw_board(self, surface: pygame.Surface) -> None:
         """
@@ -302,116 +520,94 @@ class GameUI:
         Args:
             surface: Pygame surface to draw on
         """
-        logger.debug(
-            f"_draw_board START - board position: ({self.board_x}, {self.board_y}), size: {self.board_width}x{self.board_height}"
-        )
-
-        for row in range(self.board_size):
-            for col in range(self.board_size):
-                cell_x = self.board_x + col * self.cell_size
-                cell_y = self.board_y + row * self.cell_size
-                cell_value = self.board.get_cell(row, col)
-
-                if cell_value != Player.EMPTY.value:
-                    pygame.draw.rect(
-                        surface,
-                        Colors.BACKGROUND,
-                        (cell_x, cell_y, self.cell_size, self.cell_size),
-                    )
-                else:
-                    pygame.draw.rect(
-                        surface,
-                        Colors.BOARD,
-                        (cell_x, cell_y, self.cell_size, self.cell_size),
-                    )
-
-                pygame.draw.rect(
-                    surface,
-                    Colors.BOARD_LINE,
-                    (cell_x, cell_y, self.cell_size, self.cell_size),
-                    width=2,
-                )
+        surface.blit(self._bg_surf, self._grid_rect, self._grid_rect)
 
-        logger.debug("_draw_board - cells and borders drawn")
+        self._draw_board_contents(surface)
 
-        pieces_drawn = 0
-        for row in range(self.board_size):
-            for col in range(self.board_size):
-                cell_value = self.board.get_cell(row, col)
-                if cell_value != Player.EMPTY.value:
-                    self._draw_piece(surface, row, col, cell_value)
-                    pieces_drawn += 1
+    def _draw_board_contents(self, surface: pygame.Surface) -> None:
+        """
+        Draw occupied cells, hover outline and win line over an empty grid.
 
-        logger.debug(f"_draw_board - {pieces_drawn} pieces drawn")
+        Args:
+            surface: Pygame surface whose board area already shows the empty grid
+        """
+        self._draw_pieces(surface)
 
         self._draw_hover(surface)
 
         self._draw_win_line(surface)
 
-        logger.debug("_draw_board END")
-
-    def _draw_piece(
-        self, surface: pygame.Surface, row: int, col: int, player: int
-    ) -> None:
+    def _draw_pieces(self, surface: pygame.Surface) -> None:
         """
-        Draw a single piece (X or O).
+        Draw every occupied cell tile (X or O) with a single batched blit.
 
         Args:
             surface: Pygame surface to draw on
-            row: Row position
-            col: Column position
-            player: Player value (X_PLAYER or O_PLAYER)
         """
-        logger.debug(f"_draw_piece START - row: {row}, col: {col}, player: {player}")
+        tiles = self._cell_tiles
+        cell_xs = self._cell_xs
+        cell_ys = self._cell_ys
+        board_size = self.board_size
+        blit_sequence = [
+            (tiles[piece], (cell_xs[index % board_size], cell_ys[index // board_size]))
+            for index, piece in enumerate(self.board.cells())
+            if piece != _EMPTY
+        ]
+        _blit_batch(surface, blit_sequence)
+
+    def _build_piece_surfaces(self) -> None:
+        """Pre-rasterize the cell tiles, X/O glyphs and hover outline for the cell size."""
+        size = self.cell_size
+        center = size // 2
+        radius = size // 3
+
+        x_surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.line(
+            x_surf,
+            Colors.X_COLOR,
+            (center - radius, center - radius),
+            (center + radius, center + radius),
+            5,
+        )
+        pygame.draw.line(
+            x_surf,
+            Colors.X_COLOR,
+            (center + radius, center - radius),
+            (center - radius, center + radius),
+            5,
+        )
 
-        center_x = self.board_x + col * self.cell_size + self.cell_size // 2
-        center_y = self.board_y + row * self.cell_size + self.cell_size // 2
-        radius = self.cell_size // 3
+        o_surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(o_surf, Colors.O_COLOR, (center, center), radius, 5)
 
-        logger.debug(
-            f"_draw_piece - center: ({center_x}, {center_y}), radius: {radius}"
+        hover_surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.rect(
+            hover_surf, Colors.TEXT, hover_surf.get_rect(), width=4, border_radius=4
         )
 
-        match player:
-            case Player.X_PLAYER.value:
-                color = Colors.X_COLOR
-                logger.debug(f"_draw_piece - drawing X with color: {color}")
-                pygame.draw.line(
-                    surface,
-                    color,
-                    (center_x - radius, center_y - radius),
-                    (center_x + radius, center_y + radius),
-                    5,
-                )
-                pygame.draw.line(
-                    surface,
-                    color,
-                    (center_x + radius, center_y - radius),
-                    (center_x - radius, center_y + radius),
-                    5,
-                )
+        piece_surfs = {_X: x_surf, _O: o_surf}
+        cell_tiles = {}
+        for value in (_EMPTY, _X, _O):
+            glyph = piece_surfs.get(value)
+            tile = pygame.Surface((size, size))
+            tile.fill(Colors.BOARD if glyph is None else Colors.BACKGROUND)
+            pygame.draw.rect(tile, Colors.BOARD_LINE, tile.get_rect(), width=2)
+            if glyph is not None:
+                tile.blit(glyph, (0, 0))
+            cell_tiles[value] = tile
 
-            case Player.O_PLAYER.value:
-                color = Colors.O_COLOR
-                logger.debug(f"_draw_piece - drawing O with color: {color}")
-                pygame.draw.circle(surface, color, (center_x, center_y), radius, 5)
+        if pygame.display.get_surface() is not None:
+            hover_surf = hover_surf.convert_alpha()
+            cell_tiles = {value: tile.convert() for value, tile in cell_tiles.items()}
 
-        logger.debug("_draw_piece END")
+        self._cell_tiles = cell_tiles
+        self._hover_surf = hover_surf
 
     def _draw_hover(self, surface: pygame.Surface) -> None:
         """Draw hover effect on valid moves."""
         if self.hovered_cell and not self.game_over:
             row, col = self.hovered_cell
-            cell_x = self.board_x + col * self.cell_size
-            cell_y = self.board_y + row * self.cell_size
-
-            pygame.draw.rect(
-                surface,
-                Colors.TEXT,
-                (cell_x, cell_y, self.cell_size, self.cell_size),
-                width=4,
-                border_radius=4,
-            )
+            surface.blit(self._hover_surf, (self._cell_xs[col], self._cell_ys[row]))
 
     def _draw_win_line(self, surface: pygame.Surface) -> None:
         """Draw line through winning combination."""
@@ -420,14 +616,9 @@ class GameUI:
 
         win_line = self._get_win_line()
         if win_line:
-            start_pos = (
-                self.board_x + win_line[0][1] * self.cell_size + self.cell_size // 2,
-                self.board_y + win_line[0][0] * self.cell_size + self.cell_size // 2,
-            )
-            end_pos = (
-                self.board_x + win_line[2][1] * self.cell_size + self.cell_size // 2,
-                self.board_y + win_line[2][0] * self.cell_size + self.cell_size // 2,
-            )
+            (start_row, start_col), _, (end_row, end_col) = win_line
+            start_pos = (self._cell_cxs[start_col], self._cell_cys[start_row])
+            end_pos = (self._cell_cxs[end_col], self._cell_cys[end_row])
 
             pygame.draw.line(surface, Colors.WIN_LINE, start_pos, end_pos, 8)
 
@@ -438,80 +629,13 @@ class GameUI:
         Returns:
             List of (row, col) tuples for winning line, or None
         """
-        for row in range(self.board_size):
-            if (
-                self.board.board[row, 0]
-                == self.board.board[row, 1]
-                == self.board.board[row, 2]
-                != Player.EMPTY.value
-            ):
-                return [(row, 0), (row, 1), (row, 2)]
-
-        for col in range(self.board_size):
-            if (
-                self.board.board[0, col]
-                == self.board.board[1, col]
-                == self.board.board[2, col]
-                != Player.EMPTY.value
-            ):
-                return [(0, col), (1, col), (2, col)]
-
-        if (
-            self.board.board[0, 0]
-            == self.board.board[1, 1]
-            == self.board.board[2, 2]
-            != Player.EMPTY.value
-        ):
-            return [(0, 0), (1, 1), (2, 2)]
-
-        if (
-            self.board.board[0, 2]
-            == self.board.board[1, 1]
-            == self.board.board[2, 0]
-            != Player.EMPTY.value
-        ):
-            return [(0, 2), (1, 1), (2, 0)]
+        cells = self.board.cells()
+        for a, b, c in WIN_LINES:
+            if cells[a] == cells[b] == cells[c] != _EMPTY:
+                return [divmod(index, self.board_size) for index in (a, b, c)]
 
         return None
 
-    def _draw_status(self, surface: pygame.Surface) -> None:
-        """Draw game status text."""
-        status_text = ""
-        if self.game_over:
-            if self.winner is None:
-                status_text = "Draw! Press R to restart"
-            else:
-                winner_name = "X" if self.winner == Player.X_PLAYER.value else "O"
-                status_text = f"{winner_name} wins! Press R to restart"
-        else:
-            current_name = "X" if self.current_player == Player.X_PLAYER.value else "O"
-            status_text = f"{current_name}'s turn"
-
-        board_height = self.board_size * self.cell_size
-        line_y = board_height + 20
-        text_y = board_height + 70
-
-        pygame.draw.line(surface, Colors.BOARD, (0, line_y), (self.width, line_y), 2)
-        text_surface = self.status_font.render(status_text, True, Colors.BOARD)
-        text_rect = text_surface.get_rect(center=(self.width // 2, text_y))
-        surface.blit(text_surface, text_rect)
-
-    def run(self) -> None:
-        """Main game loop."""
-        logger.info("Starting game loop")
-
-        while self.running:
-            self.update()
-            self.render()
-            self.clock.tick(60)
-
-        logger.info("Game loop ended")
-        pygame.quit()
-
-    def quit(self) -> None:
-        """Quit the game."""
-        self.running = False
-
     def get_board(self) -> Board:
         """
         Get the current board state.
@@ -559,22 +683,6 @@ class GameUI:
         self.current_player = player
         logger.debug(f"Current player set to: {player}")
 
-    def on_resize(self, width: int, height: int) -> None:
-        """
-        Handle window resize.
-
-        Args:
-            width: New window width
-            height: New window height
-        """
-        self.width = width
-        self.height = height
-        self.cell_size = min(width, height) // 3
-        self.font = pygame.font.Font(None, self.cell_size // 2)
-        self.status_font = pygame.font.Font(None, self.cell_size // 3)
-
-        logger.info(f"GameUI resized to {width}x{height}")
-
     def is_back_button_clicked(self, mouse_x: int, mouse_y: int) -> bool:
         """
         Check if the back button was clicked.
@@ -593,55 +701,41 @@ class GameUI:
             <= self.back_button_y + self.back_button_height
         )
 
-    def _draw_back_button(self, surface: pygame.Surface) -> None:
+    def _build_back_button(self) -> pygame.Surface:
         """
-        Draw the back button.
+        Composite the back button background, border and label into one surface.
 
-        Args:
-            surface: Pygame surface to draw on
+        Returns:
+            Surface holding the finished back button
         """
-        logger.debug(
-            f"_draw_back_button START - position: ({self.back_button_x}, {self.back_button_y}), size: {self.back_button_width}x{self.back_button_height}"
+        button_surf = pygame.Surface(
+            (self.back_button_width, self.back_button_height), pygame.SRCALPHA
         )
-
+        button_rect = button_surf.get_rect()
         pygame.draw.rect(
-            surface,
-            Colors.BUTTON_BACKGROUND,
-            (
-                self.back_button_x,
-                self.back_button_y,
-                self.back_button_width,
-                self.back_button_height,
-            ),
-            border_radius=8,
+            button_surf, Colors.BUTTON_BACKGROUND, button_rect, border_radius=8
         )
-        logger.debug("_draw_back_button - background drawn")
-
         pygame.draw.rect(
-            surface,
-            Colors.BUTTON_BORDER,
-            (
-                self.back_button_x,
-                self.back_button_y,
-                self.back_button_width,
-                self.back_button_height,
-            ),
-            width=2,
-            border_radius=8,
+            button_surf, Colors.BUTTON_BORDER, button_rect, width=2, border_radius=8
         )
-        logger.debug("_draw_back_button - border drawn")
 
-        back_text = self.fonts["ui"].render("Back", True, Colors.TEXT)
-        text_rect = back_text.get_rect(
-            center=(
-                self.back_button_x + self.back_button_width // 2,
-                self.back_button_y + self.back_button_height // 2,
-            )
-        )
-        surface.blit(back_text, text_rect)
-        logger.debug(f"_draw_back_button - text drawn at position: {text_rect.center}")
+        back_text = self._render_text(self.fonts[FontSlot.UI], "Back", Colors.TEXT)
+        button_surf.blit(back_text, back_text.get_rect(center=button_rect.center))
+
+        if pygame.display.get_surface() is not None:
+            button_surf = button_surf.convert_alpha()
+        return button_surf
+
+    def _draw_back_button(self, surface: pygame.Surface) -> None:
+        """
+        Draw the back button.
 
-        logger.debug("_draw_back_button END")
+        Args:
+            surface: Pygame surface to draw on
+        """
+        if self._back_button_surf is None:
+            self._back_button_surf = self._build_back_button()
+        surface.blit(self._back_button_surf, (self.back_button_x, self.back_button_y))
 
     def _draw_game_status(self, surface: pygame.Surface) -> None:
         """
@@ -650,34 +744,23 @@ class GameUI:
         Args:
             surface: Pygame surface to draw on
         """
-        logger.debug(f"_draw_game_status START - game_over: {self.game_over}")
-
         if not self.game_over:
-            logger.debug("_draw_game_status - game not over, skipping status display")
             return
 
         status_y = min(self.board_y + self.board_height + 20, surface.get_height() - 30)
-        logger.debug(f"_draw_game_status - status_y: {status_y}")
 
         if self.winner:
             status_text = f"Game Over! {self.winner} wins!"
             color = Colors.TEXT
-            logger.debug(f"_draw_game_status - winner status: '{status_text}'")
         else:
             status_text = "Game Over! It's a draw!"
             color = Colors.TEXT
-            logger.debug(f"_draw_game_status - draw status: '{status_text}'")
 
-        status_surface = self.fonts["ui"].render(status_text, True, color)
+        status_surface = self._render_text(self.fonts[FontSlot.UI], status_text, color)
         status_rect = status_surface.get_rect(
             center=(surface.get_width() // 2, status_y)
         )
         surface.blit(status_surface, status_rect)
-        logger.debug(
-            f"_draw_game_status - status text drawn at position: {status_rect.center}"
-        )
-
-        logger.debug("_draw_game_status END")
 
     def _get_current_player_name(self) -> str:
         """
@@ -686,10 +769,4 @@ class GameUI:
         Returns:
             Current player name
         """
-        match self.current_player:
-            case Player.X_PLAYER.value:
-                return self.player_x_name
-            case Player.O_PLAYER.value:
-                return self.player_o_name
-            case _:
-                return "Unknown"
+        return self._player_names.get(self.current_player, "Unknown")
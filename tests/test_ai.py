@@ -2,12 +2,12 @@
 Unit tests for the AI class.
 """
 
-from unittest.mock import patch
+from unittest.mock import PropertyMock, patch
 
-from tictactoe.ai import AI
-from tictactoe.board import Board
 from tictactoe.consts.ai_consts import INFINITY, NEGATIVE_INFINITY, Depth, Difficulty
 from tictactoe.consts.board_consts import Player
+from tictactoe.domain.ai import AI
+from tictactoe.domain.board import Board
 
 
 class TestAI:
@@ -75,7 +75,7 @@ class TestAI:
         ai = AI()
         board = Board()
 
-        with patch.object(ai, "minimax") as mock_minimax:
+        with patch("tictactoe.domain.ai._minimax_bb") as mock_minimax:
             mock_minimax.return_value = 5
             move = ai._get_minimax_move(board, depth=3)
             assert move == (0, 0)
@@ -216,6 +216,21 @@ class TestAI:
         move = ai.get_move(board)
         assert move == (0, 2)
 
+    def test_search_does_not_copy_board(self) -> None:
+        """Test that searching never materializes a copy of the board."""
+        ai = AI(Difficulty.MEDIUM)
+        board = Board()
+        board.apply((0, 0), Player.X_PLAYER.value)
+
+        with patch.object(board, "get_board_copy") as mock_copy:
+            with patch.object(Board, "board", new_callable=PropertyMock) as mock_array:
+                ai.get_move(board)
+                ai.minimax(
+                    board, depth=2, is_max=True, alpha=NEGATIVE_INFINITY, beta=INFINITY
+                )
+                mock_copy.assert_not_called()
+                mock_array.assert_not_called()
+
     def test_difficulty_comparison(self) -> None:
         """Test difficulty level comparisons."""
         easy_ai = AI(Difficulty.EASY)
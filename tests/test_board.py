@@ -4,8 +4,8 @@ Unit tests for the Board class.
 
 import numpy as np
 
-from tictactoe.board import Board
 from tictactoe.consts.board_consts import BOARD_SIZE, Player, Score
+from tictactoe.domain.board import Board
 
 
 class TestBoard:
@@ -216,3 +216,42 @@ class TestBoard:
         assert "X" in result
         assert "O" in result
         assert "|" in result
+
+    def test_canonical_key_symmetric_positions(self) -> None:
+        """Test rotated and reflected positions share a canonical key."""
+        corner = Board()
+        corner.apply((0, 0), Player.X_PLAYER.value)
+        corner.apply((0, 1), Player.O_PLAYER.value)
+        rotated = Board()
+        rotated.apply((0, 2), Player.X_PLAYER.value)
+        rotated.apply((1, 2), Player.O_PLAYER.value)
+        reflected = Board()
+        reflected.apply((0, 0), Player.X_PLAYER.value)
+        reflected.apply((1, 0), Player.O_PLAYER.value)
+        assert corner.canonical_key() == rotated.canonical_key()
+        assert corner.canonical_key() == reflected.canonical_key()
+
+        swapped = Board()
+        swapped.apply((0, 0), Player.O_PLAYER.value)
+        swapped.apply((0, 1), Player.X_PLAYER.value)
+        assert corner.canonical_key() != swapped.canonical_key()
+
+    def test_status(self) -> None:
+        """Test status reports the winner and fullness together."""
+        board = Board()
+        assert board.status() == (None, False)
+
+        board.apply((0, 0), Player.O_PLAYER.value)
+        board.apply((1, 1), Player.O_PLAYER.value)
+        board.apply((2, 2), Player.O_PLAYER.value)
+        assert board.status() == (Player.O_PLAYER.value, False)
+
+    def test_without_history(self) -> None:
+        """Test moves applied inside without_history are not recorded."""
+        board = Board()
+        board.apply((0, 0), Player.X_PLAYER.value)
+        with board.without_history():
+            board.apply((1, 1), Player.O_PLAYER.value)
+            board.undo((1, 1))
+        assert board.move_history == [((0, 0), Player.X_PLAYER.value)]
+        assert board.record_history is True
@@ -2,12 +2,11 @@
 Unit tests for the storage module.
 """
 
-import tempfile
-from pathlib import Path
+import sqlite3
 
 import pytest
 
-from tictactoe.storage import MatchRecord, PlayerStats, Storage
+from tictactoe.infra.storage import MatchRecord, PlayerStats, Storage
 
 
 class TestStorage:
@@ -15,27 +14,28 @@ class TestStorage:
 
     def setup_method(self) -> None:
         """Set up test fixtures before each test method."""
-        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
-        self.temp_db.close()
-        self.storage = Storage(self.temp_db.name)
+        self.storage = Storage(":memory:")
+        self.conn = self.storage._conn
 
     def teardown_method(self) -> None:
         """Clean up after each test method."""
-        Path(self.temp_db.name).unlink(missing_ok=True)
+        assert not self.conn.in_transaction
+        self.storage.close()
+
+    def _execute(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        """Run a query on the storage's connection, returning named rows."""
+        cursor = self.conn.cursor()
+        cursor.row_factory = sqlite3.Row
+        return cursor.execute(sql, params)
 
     def test_init_creates_tables(self) -> None:
         """Test that initialization creates the required tables."""
-        import sqlite3
-
-        with sqlite3.connect(self.temp_db.name) as conn:
-            cursor = conn.cursor()
+        # noinspection SqlResolve
+        rows = self._execute("SELECT name FROM sqlite_master WHERE type='table'")
+        tables = [row["name"] for row in rows]
 
-            # noinspection SqlResolve
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            tables = [row[0] for row in cursor.fetchall()]
-
-            assert "players" in tables
-            assert "matches" in tables
+        assert "players" in tables
+        assert "matches" in tables
 
     def test_get_or_create_player_id_new_player(self) -> None:
         """Test creating a new player."""
@@ -43,16 +43,13 @@ class TestStorage:
 
         assert player_id == 1
 
-        import sqlite3
-
-        with sqlite3.connect(self.temp_db.name) as conn:
-            cursor = conn.cursor()
-            # noinspection SqlResolve
-            cursor.execute("SELECT name FROM players WHERE id = ?", (player_id,))
-            result = cursor.fetchone()
+        # noinspection SqlResolve
+        result = self._execute(
+            "SELECT name FROM players WHERE id = ?", (player_id,)
+        ).fetchone()
 
-            assert result is not None
-            assert result[0] == "Alice"
+        assert result is not None
+        assert result["name"] == "Alice"
 
     def test_get_or_create_player_id_existing_player(self) -> None:
         """Test getting existing player ID."""
@@ -89,69 +86,80 @@ class TestStorage:
         """Test recording a valid PvP match."""
         self.storage.record_match("Alice", "Bob", "X", "pvp")
 
-        import sqlite3
+        # noinspection SqlResolve
+        rows = self._execute(
+            "SELECT player_x_id, player_o_id, result, mode, ai_level FROM matches"
+        ).fetchall()
 
-        with sqlite3.connect(self.temp_db.name) as conn:
-            cursor = conn.cursor()
-            # noinspection SqlResolve
-            cursor.execute("SELECT COUNT(*) FROM matches")
-            count = cursor.fetchone()[0]
-
-            assert count == 1
-
-            # noinspection SqlResolve
-            cursor.execute(
-                "SELECT player_x_id, player_o_id, result, mode, ai_level FROM matches"
-            )
-            result = cursor.fetchone()
+        assert len(rows) == 1
+        result = rows[0]
 
-            assert result[2] == "X"
-            assert result[3] == "pvp"
-            assert result[4] is None
+        assert result["result"] == "X"
+        assert result["mode"] == "pvp"
+        assert result["ai_level"] is None
 
     def test_record_match_pvai_valid(self) -> None:
         """Test recording a valid PvAI match."""
         self.storage.record_match("Alice", "AI", "O", "pvai", "hard")
 
-        import sqlite3
-
-        with sqlite3.connect(self.temp_db.name) as conn:
-            cursor = conn.cursor()
-            # noinspection SqlResolve
-            cursor.execute("SELECT COUNT(*) FROM matches")
-            count = cursor.fetchone()[0]
-
-            assert count == 1
-
-            # noinspection SqlResolve
-            cursor.execute(
-                "SELECT player_x_id, player_o_id, result, mode, ai_level FROM matches"
-            )
-            result = cursor.fetchone()
-
-            assert result[2] == "O"
-            assert result[3] == "pvai"
-            assert result[4] == "hard"
-
-    def test_record_match_invalid_result_raises_error(self) -> None:
-        """Test that invalid result raises ValueError."""
+        # noinspection SqlResolve
+        rows = self._execute(
+            "SELECT player_x_id, player_o_id, result, mode, ai_level FROM matches"
+        ).fetchall()
+
+        assert len(rows) == 1
+        result = rows[0]
+
+        assert result["result"] == "O"
+        assert result["mode"] == "pvai"
+        assert result["ai_level"] == "hard"
+
+    @pytest.mark.parametrize(
+        ("args", "match"),
+        [
+            (("Alice", "Bob", "Invalid", "pvp"), "Invalid result"),
+            (("Alice", "Bob", "X", "invalid"), "Invalid mode"),
+            (("Alice", "AI", "X", "pvai", "invalid"), "Invalid AI level for PvAI mode"),
+            (
+                ("Alice", "Bob", "X", "pvp", "easy"),
+                "AI level should be None for PvP mode",
+            ),
+        ],
+        ids=[
+            "invalid_result",
+            "invalid_mode",
+            "pvai_invalid_ai_level",
+            "pvp_with_ai_level",
+        ],
+    )
+    def test_record_match_invalid_input_raises_error(
+        self, args: tuple[str, ...], match: str
+    ) -> None:
+        """Test that invalid match details raise ValueError."""
+        with pytest.raises(ValueError, match=match):
+            self.storage.record_match(*args)
+
+    def test_record_matches_invalid_row_records_nothing(self) -> None:
+        """Test that one invalid match rejects the whole batch."""
         with pytest.raises(ValueError, match="Invalid result"):
-            self.storage.record_match("Alice", "Bob", "Invalid", "pvp")
+            self.storage.record_matches(
+                [
+                    ("Alice", "Bob", "X", "pvp", None),
+                    ("Alice", "Bob", "Invalid", "pvp", None),
+                ]
+            )
 
-    def test_record_match_invalid_mode_raises_error(self) -> None:
-        """Test that invalid mode raises ValueError."""
-        with pytest.raises(ValueError, match="Invalid mode"):
-            self.storage.record_match("Alice", "Bob", "X", "invalid")
+        assert self.storage.recent_matches() == []
 
-    def test_record_match_pvai_invalid_ai_level_raises_error(self) -> None:
-        """Test that invalid AI level for PvAI raises ValueError."""
-        with pytest.raises(ValueError, match="Invalid AI level for PvAI mode"):
-            self.storage.record_match("Alice", "AI", "X", "pvai", "invalid")
+    def test_record_matches_spans_insert_batches(self) -> None:
+        """Test recording more matches than fit in one INSERT statement."""
+        self.storage.record_matches(
+            [("Alice", "Bob", "X", "pvp", None) for _ in range(250)]
+        )
 
-    def test_record_match_pvp_with_ai_level_raises_error(self) -> None:
-        """Test that PvP mode with AI level raises ValueError."""
-        with pytest.raises(ValueError, match="AI level should be None for PvP mode"):
-            self.storage.record_match("Alice", "Bob", "X", "pvp", "easy")
+        summary = self.storage.get_stats_summary()
+        assert summary["total_players"] == 2
+        assert summary["total_matches"] == 250
 
     def test_leaderboard_empty_database(self) -> None:
         """Test leaderboard with empty database."""
@@ -172,7 +180,7 @@ class TestStorage:
         assert leaderboard[0].ai_easy_wins == 0
         assert leaderboard[0].ai_medium_wins == 0
         assert leaderboard[0].ai_hard_wins == 0
-        assert leaderboard[0].win_percentage == 1.0
+        assert leaderboard[0].win_percentage == 100.0
         assert leaderboard[0].total_games == 1
 
     def test_leaderboard_multiple_players_sorted(self) -> None:
@@ -223,11 +231,12 @@ class TestStorage:
 
         leaderboard = self.storage.leaderboard()
 
-        alice_stats = next(p for p in leaderboard if p.name == "Alice")
+        by_name = {p.name: p for p in leaderboard}
+        alice_stats = by_name["Alice"]
         # Alice has 2 wins out of 3 games (1 as X, 1 as O, 1 draw)
         assert alice_stats.total_wins == 2
         assert alice_stats.total_games == 3
-        assert alice_stats.win_percentage == 0.67
+        assert alice_stats.win_percentage == 66.7
 
     def test_recent_matches_empty_database(self) -> None:
         """Test recent matches with empty database."""
@@ -273,8 +282,9 @@ class TestStorage:
 
     def test_recent_matches_limit(self) -> None:
         """Test limiting the number of recent matches."""
-        for i in range(5):
-            self.storage.record_match(f"Player{i}", "Bob", "X", "pvp")
+        self.storage.record_matches(
+            [(f"Player{i}", "Bob", "X", "pvp", None) for i in range(5)]
+        )
 
         matches = self.storage.recent_matches(limit=3)
 
@@ -285,30 +295,20 @@ class TestStorage:
         self.storage.record_match("Alice", "Bob", "X", "pvp")
         self.storage.record_match("Alice", "AI", "O", "pvai", "easy")
 
-        import sqlite3
-
-        with sqlite3.connect(self.temp_db.name) as conn:
-            cursor = conn.cursor()
-            # noinspection SqlResolve
-            cursor.execute("SELECT COUNT(*) FROM players")
-            players_before = cursor.fetchone()[0]
-            # noinspection SqlResolve
-            cursor.execute("SELECT COUNT(*) FROM matches")
-            matches_before = cursor.fetchone()[0]
+        # noinspection SqlResolve
+        players_before, matches_before = self._execute(
+            "SELECT (SELECT COUNT(*) FROM players), (SELECT COUNT(*) FROM matches)"
+        ).fetchone()
 
         assert players_before > 0
         assert matches_before > 0
 
         self.storage.reset_data()
 
-        with sqlite3.connect(self.temp_db.name) as conn:
-            cursor = conn.cursor()
-            # noinspection SqlResolve
-            cursor.execute("SELECT COUNT(*) FROM players")
-            players_after = cursor.fetchone()[0]
-            # noinspection SqlResolve
-            cursor.execute("SELECT COUNT(*) FROM matches")
-            matches_after = cursor.fetchone()[0]
+        # noinspection SqlResolve
+        players_after, matches_after = self._execute(
+            "SELECT (SELECT COUNT(*) FROM players), (SELECT COUNT(*) FROM matches)"
+        ).fetchone()
 
         assert players_after == 0
         assert matches_after == 0
@@ -379,8 +379,9 @@ class TestStorage:
 
     def test_leaderboard_limit(self) -> None:
         """Test leaderboard limit parameter."""
-        for i in range(10):
-            self.storage.record_match(f"Player{i}", "Bob", "X", "pvp")
+        self.storage.record_matches(
+            [(f"Player{i}", "Bob", "X", "pvp", None) for i in range(10)]
+        )
 
         leaderboard = self.storage.leaderboard(limit=5)
 
@@ -388,28 +389,33 @@ class TestStorage:
 
     def test_complex_scenario(self) -> None:
         """Test a complex scenario with multiple players and game types."""
-        # PvP matches
-        self.storage.record_match("Alice", "Bob", "X", "pvp")
-        self.storage.record_match("Alice", "Bob", "O", "pvp")
-        self.storage.record_match("Alice", "Bob", "Draw", "pvp")
-        self.storage.record_match("Charlie", "Alice", "X", "pvp")
-        self.storage.record_match("Charlie", "Bob", "O", "pvp")
-
-        # PvAI matches
-        self.storage.record_match("Alice", "AI", "X", "pvai", "easy")
-        self.storage.record_match("Alice", "AI", "O", "pvai", "easy")
-        self.storage.record_match("Alice", "AI", "X", "pvai", "medium")
-        self.storage.record_match("Bob", "AI", "O", "pvai", "medium")
-        self.storage.record_match("Bob", "AI", "Draw", "pvai", "hard")
-        self.storage.record_match("Charlie", "AI", "X", "pvai", "hard")
-        self.storage.record_match("Charlie", "AI", "X", "pvai", "hard")
+        self.storage.record_matches(
+            [
+                # PvP matches
+                ("Alice", "Bob", "X", "pvp", None),
+                ("Alice", "Bob", "O", "pvp", None),
+                ("Alice", "Bob", "Draw", "pvp", None),
+                ("Charlie", "Alice", "X", "pvp", None),
+                ("Charlie", "Bob", "O", "pvp", None),
+                # PvAI matches
+                ("Alice", "AI", "X", "pvai", "easy"),
+                ("Alice", "AI", "O", "pvai", "easy"),
+                ("Alice", "AI", "X", "pvai", "medium"),
+                ("Bob", "AI", "O", "pvai", "medium"),
+                ("Bob", "AI", "Draw", "pvai", "hard"),
+                ("Charlie", "AI", "X", "pvai", "hard"),
+                ("Charlie", "AI", "X", "pvai", "hard"),
+            ]
+        )
 
         # Test leaderboard
         leaderboard = self.storage.leaderboard()
         assert len(leaderboard) == 4
 
+        by_name = {p.name: p for p in leaderboard}
+
         # Alice should be first (3 wins)
-        alice = next(p for p in leaderboard if p.name == "Alice")
+        alice = by_name["Alice"]
         assert alice.total_wins == 3
         assert alice.pvp_wins == 1
         assert alice.ai_easy_wins == 1
@@ -417,7 +423,7 @@ class TestStorage:
         assert alice.ai_hard_wins == 0
 
         # Charlie should be second (3 wins, but more PvAI wins)
-        charlie = next(p for p in leaderboard if p.name == "Charlie")
+        charlie = by_name["Charlie"]
         assert charlie.total_wins == 3
         assert charlie.pvp_wins == 1
         assert charlie.ai_easy_wins == 0
@@ -0,0 +1,81 @@
+"""
+Unit tests for the GameUI widget.
+"""
+
+import os
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from tictactoe.domain.board import Board  # noqa: E402
+from tictactoe.ui.layout import compute_layout, make_fonts  # noqa: E402
+from tictactoe.ui.widgets import GameUI  # noqa: E402
+
+WINDOW_SIZE = (800, 700)
+
+
+class TestGameUI:
+    """Test cases for the GameUI class."""
+
+    def setup_method(self) -> None:
+        """Set up a headless display and a GameUI drawing into it."""
+        pygame.display.init()
+        pygame.font.init()
+        self.screen = pygame.display.set_mode(WINDOW_SIZE)
+        layout = compute_layout(*WINDOW_SIZE)
+        self.ui = GameUI(Board(), layout, make_fonts(layout))
+
+    def teardown_method(self) -> None:
+        """Close the headless display."""
+        pygame.display.quit()
+
+    def _cell_center(self, row: int, col: int) -> tuple[int, int]:
+        """Return the pixel position of a cell's centre."""
+        return self.ui._cell_cxs[col], self.ui._cell_cys[row]
+
+    def _assert_matches_full_frame(self) -> None:
+        """Check the rendered screen against a freshly composed frame."""
+        rendered = pygame.image.tobytes(self.screen, "RGB")
+        self.ui._compose_frame(self.screen.get_size())
+        assert rendered == pygame.image.tobytes(self.ui._frame, "RGB")
+
+    def test_incremental_render_matches_full_frame(self) -> None:
+        """Test that dirty-region updates draw the same pixels as a full redraw."""
+        rng = random.Random(0)
+        cells = [(row, col) for row in range(3) for col in range(3)]
+
+        for _ in range(5):
+            self.ui._reset_game()
+            self.ui.render(self.screen)
+
+            while not self.ui.game_over:
+                self.ui.handle_mouse_motion(self._cell_center(*rng.choice(cells)))
+                self.ui.render(self.screen)
+                self._assert_matches_full_frame()
+
+                self.ui.handle_mouse_motion((0, 0))
+                self.ui.render(self.screen)
+                self._assert_matches_full_frame()
+
+                move = rng.choice(self.ui.board.legal_moves())
+                assert self.ui.handle_mouse_click(self._cell_center(*move))
+                self.ui.render(self.screen)
+                self._assert_matches_full_frame()
+
+    def test_render_skips_unchanged_state(self) -> None:
+        """Test that render reports no redraw when nothing visible changed."""
+        assert self.ui.render(self.screen) is True
+        assert self.ui.render(self.screen) is False
+
+        self.ui.handle_mouse_motion(self._cell_center(1, 1))
+        assert self.ui.render(self.screen) is True
+        assert self.ui.render(self.screen) is False
+
+        assert self.ui.handle_mouse_click(self._cell_center(1, 1))
+        assert self.ui.render(self.screen) is True
+        assert self.ui.render(self.screen) is False
+
+        self.ui.invalidate()
+        assert self.ui.render(self.screen) is True